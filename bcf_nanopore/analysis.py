@@ -18,9 +18,11 @@ Provides the following classes:
 
 import os
 import re
+import sys
 import shutil
 import logging
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from auto_process_ngs.metadata import MetadataDict
 from auto_process_ngs.metadata import item_to_name
 from auto_process_ngs.utils import get_numbered_subdir
@@ -41,6 +43,42 @@ logger.addHandler(logging.NullHandler())
 RE_PROJECT_DIR_NAME = re.compile("^PromethION_Project_([0-9]+)_(.+)$")
 RE_RUN_DIR_NAME = re.compile("^([0-9]{3}|[0-9]{2})[_-](.+)$")
 
+# Fields available from 'ProjectAnalysisDir.get_value'
+# Each field maps to a tuple of (function to get the value
+# given a ProjectAnalysisDir instance and run name, function
+# to format the value for display)
+_REPORT_FIELDS = {
+    "null": (lambda p, run: '', fmt_value),
+    "name": (lambda p, run: p.info.name, fmt_value),
+    "id": (lambda p, run: p.info.id, fmt_value),
+    "datestamp": (lambda p, run: p.datestamp(), fmt_value),
+    "datestamp_short": (lambda p, run: p.datestamp_short(), fmt_value),
+    "run_datestamp": (lambda p, run: p.datestamp(p._get_run("run_datestamp", run)),
+                      fmt_value),
+    "run_datestamp_short": (lambda p, run: p.datestamp_short(p._get_run("run_datestamp_short", run)),
+                            fmt_value),
+    "run": (lambda p, run: p._get_run("run", run), fmt_value),
+    "runs": (lambda p, run: ",".join(p.runs), fmt_value),
+    "nruns": (lambda p, run: len(p.runs), fmt_value),
+    "platform": (lambda p, run: p.info.platform, fmt_value),
+    "user": (lambda p, run: p.info.user, fmt_value),
+    "pi": (lambda p, run: p.info.PI, fmt_value),
+    "application": (lambda p, run: p.info.application, fmt_value),
+    "organism": (lambda p, run: p.info.organism, fmt_value),
+    "nsamples": (lambda p, run: p._get_nsamples(run),
+                 lambda s: '?' if s == "" else s),
+    "samples": (lambda p, run: p._get_sample_names(run), fmt_value),
+    "primary_data": (lambda p, run: p.info.data_dir, fmt_value),
+    "analysis_dir": (lambda p, run: p.path, fmt_value),
+    "comments": (lambda p, run: p.info.comments,
+                 lambda s: '' if s is None else str(s)),
+}
+# Aliases share the definition of the original field
+_REPORT_FIELDS[""] = _REPORT_FIELDS["null"]
+_REPORT_FIELDS["#runs"] = _REPORT_FIELDS["nruns"]
+_REPORT_FIELDS["#samples"] = _REPORT_FIELDS["nsamples"]
+_REPORT_FIELDS["sample_names"] = _REPORT_FIELDS["samples"]
+
 class ProjectAnalysisDir:
     """
     Create and manage directory for analysing PromethION project
@@ -87,26 +125,38 @@ class ProjectAnalysisDir:
                  custom_run_metadata_items=None):
         # Top-level metadata
         self.path = os.path.abspath(path)
-        print(self.path)
+        logger.debug("ProjectAnalysisDir path: %s", self.path)
         # Additional metadata items
         self._custom_project_metadata_items = custom_project_metadata_items
         self._custom_run_metadata_items = custom_run_metadata_items
+        # Cache of samples information for each run (loaded
+        # on demand)
+        self._samples_info = {}
+        # Scan the directory contents once to locate the
+        # project metadata file and build a dictionary of
+        # run_dirs and their directories
+        self.run_dirs = {}
+        have_project_info = False
+        try:
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    if entry.name == "project.info":
+                        have_project_info = True
+                    elif entry.is_dir():
+                        m = RE_RUN_DIR_NAME.match(entry.name)
+                        if m:
+                            self.run_dirs[m.group(2)] = entry.name
+        except FileNotFoundError:
+            pass
         # Load top-level metadata
         self.project_info_file = os.path.join(self.path,
                                               "project.info")
         self.info = ProjectInfo(custom_items=self._custom_project_metadata_items)
-        if os.path.exists(self.project_info_file):
+        if have_project_info:
             self.info.load(self.project_info_file)
         else:
             logger.warning("%s: no 'project.info' file found" %
                            self.path)
-        # Dictionary of run_dirs and their directories
-        self.run_dirs = {}
-        if self.exists():
-            for d in os.listdir(self.path):
-                if os.path.isdir(os.path.join(self.path, d)) and RE_RUN_DIR_NAME.match(d):
-                    run_name = RE_RUN_DIR_NAME.match(d).group(2)
-                    self.run_dirs[run_name] = d
 
     def create(self, project_dir, user, PI, application, organism):
         """
@@ -130,36 +180,38 @@ class ProjectAnalysisDir:
             raise OSError("%s: already exists" % self.path)
         # Load source project directory
         project = ProjectDir(project_dir)
-        # Make directory and add top-level metadata
-        os.makedirs(self.path)
-        metadata = {
-            'user': user,
-            'PI': PI,
-            'application': application,
-            'organism': organism
-        }
-        for item in metadata:
-            if metadata[item] is not None:
-                self.info[item] = str(metadata[item]).strip()
-        self.info['data_dir'] = os.path.abspath(project_dir)
-        self.info['name'] = os.path.basename(self.info['data_dir'])
-        self.info['id'] = self._make_project_id(self.info['name'])
+        path = self.path
+        # Make directory and subdirectories
+        for d in (path,
+                  os.path.join(path, "logs"),
+                  os.path.join(path, "ScriptCode")):
+            os.makedirs(d, exist_ok=True)
+        # Add top-level metadata
+        for item, value in (('user', user),
+                            ('PI', PI),
+                            ('application', application),
+                            ('organism', organism)):
+            if value is not None:
+                self.info[item] = str(value).strip()
+        data_dir = os.path.abspath(project_dir)
+        data_dir_base = os.path.basename(data_dir)
+        self.info['data_dir'] = data_dir
+        self.info['name'] = data_dir_base
+        self.info['id'] = self._make_project_id(data_dir_base)
         self.info['platform'] = "promethion"
         self.info.save(filen=self.project_info_file)
         # Import runs from the source project directory
         self.import_runs(project)
-        # Make subdirectories
-        for subdir in ("logs", "ScriptCode"):
-            Path(self.path).joinpath(subdir).mkdir()
         # Create a README file
-        read_me_file = os.path.join(self.path, "README")
+        project_info_base = os.path.basename(self.project_info_file)
+        read_me_file = os.path.join(path, "README")
         with open(read_me_file, 'wt') as read_me:
             read_me.write(
-                f"""This is the analysis directory for {os.path.basename(self.info.data_dir)}
+                f"""This is the analysis directory for {data_dir_base}
 
 The following files and directories have been automatically generated:
 
-- '{os.path.basename(self.project_info_file)}': top-level information about the project
+- '{project_info_base}': top-level information about the project
 - Subdirectories for each run in the project, named with a leading
   number to indicate order of processing (e.g. '001_{project.runs[0].name}'):
 - 'logs': directory for log files;
@@ -217,86 +269,97 @@ The following files and directories have been automatically generated:
             flow_cell_basecalls_file = os.path.join(run_dir,
                                                     "flowcell_basecalls.tsv")
             fc_file = FlowcellBasecallsInfo()
-            # Add information for flow cells in the run
+            # Reports to copy into the run directory
+            copy_jobs = []
+            # Add information and collect reports for flow cells
+            # in the run
             for fc in run.flow_cells:
+                md = fc.metadata
                 fc_file.add_base_calls(
                     run=run.name,
                     sub_dir=os.path.relpath(fc.path, project.path),
                     flow_cell_id=fc.id,
                     reports=(",".join(fc.report_types)
                              if fc.report_types else "none"),
-                    kit=fmt_value(fc.metadata.kit),
+                    kit=fmt_value(md.kit),
                     modifications=("none"
-                                   if fc.metadata.modified_basecalling == "Off"
-                                   else fmt_value(fc.metadata.modifications)),
-                    trim_barcodes=fmt_value(fc.metadata.trim_barcodes),
-                    minknow_version=fc.metadata.software_versions["minknow"],
-                    basecalling_model=fmt_value(fc.metadata.basecalling_model),
+                                   if md.modified_basecalling == "Off"
+                                   else fmt_value(md.modifications)),
+                    trim_barcodes=fmt_value(md.trim_barcodes),
+                    minknow_version=md.software_versions["minknow"],
+                    basecalling_model=fmt_value(md.basecalling_model),
                     file_types=(",".join(fc.file_types)
                                 if fc.file_types else "none"))
-            # Add information for basecalls dirs in the run
+                report = fc.html_report
+                if report:
+                    target = os.path.join(run_dir,
+                                          "%s_%s_%s" % (fc.run,
+                                                        fc.id,
+                                                        os.path.basename(report)))
+                    copy_jobs.append((report, target))
+            # Add information and collect reports for basecalls
+            # dirs in the run
             for bc in run.basecalls_dirs:
+                md = bc.metadata
                 fc_file.add_base_calls(
                     run=run.name,
                     sub_dir=os.path.relpath(bc.path, project.path),
-                    flow_cell_id=fmt_value(bc.metadata.flow_cell_id),
+                    flow_cell_id=fmt_value(md.flow_cell_id),
                     reports=(",".join(bc.report_types)
                              if bc.report_types else "none"),
-                    kit=fmt_value(bc.metadata.kit),
+                    kit=fmt_value(md.kit),
                     modifications=("none"
-                                   if bc.metadata.modified_basecalling == "Off"
-                                   else fmt_value(bc.metadata.modifications)),
-                    trim_barcodes=fmt_value(bc.metadata.trim_barcodes),
-                    minknow_version=bc.metadata.software_versions["minknow"],
-                    basecalling_model=fmt_value(bc.metadata.basecalling_model),
+                                   if md.modified_basecalling == "Off"
+                                   else fmt_value(md.modifications)),
+                    trim_barcodes=fmt_value(md.trim_barcodes),
+                    minknow_version=md.software_versions["minknow"],
+                    basecalling_model=fmt_value(md.basecalling_model),
                     file_types=(",".join(bc.file_types)
                                 if bc.file_types else "none"))
+                report = bc.html_report
+                if report:
+                    target = os.path.join(run_dir,
+                                          "%s_%s_%s_%s" % (bc.parent,
+                                                           bc.run,
+                                                           md.flow_cell_id,
+                                                           os.path.basename(report)))
+                    copy_jobs.append((report, target))
             # Save flow cell/base calls info file
             fc_file.save(flow_cell_basecalls_file)
-            # Copy in flow cell base calling reports
-            for fc in run.flow_cells:
-                report = fc.html_report
-                if not report:
-                    continue
-                target = os.path.join(run_dir,
-                                      "%s_%s_%s" % (fc.run,
-                                                    fc.id,
-                                                    os.path.basename(report)))
-                shutil.copy(report, target)
-            # Copy in other base calling reports
-            for bc in project.basecalls_dirs:
-                report = bc.html_report
-                if not report:
-                    continue
-                target = os.path.join(run_dir,
-                                      "%s_%s_%s_%s" % (bc.parent,
-                                                       bc.run,
-                                                       bc.metadata.flow_cell_id,
-                                                       os.path.basename(report)))
-                shutil.copy(report, target)
+            # Copy in the reports
+            # NB copies are independent so run them concurrently;
+            # 'copyfile' uses zero-copy operations where the
+            # platform supports them (e.g. 'sendfile' on Linux)
+            if copy_jobs:
+                with ThreadPoolExecutor(
+                        max_workers=min(len(copy_jobs), 8)) as executor:
+                    # Consume the results so that any exceptions
+                    # are raised here
+                    list(executor.map(lambda job: shutil.copyfile(*job),
+                                      copy_jobs))
             # Create a template samples file
             samples_file = os.path.join(run_dir, "samples.tsv")
             with open(samples_file, "wt") as fp:
                 fp.write("#Sample\tBarcode\tFlowcell\n")
             # Create a README file for the run
             read_me_file = os.path.join(run_dir, "README")
-            with open(read_me_file, "wt") as read_me:
-                read_me.write(
-                    f"""This is the analysis directory for run '{run.name}' of project '{self.info.name}'.
+            read_me = [f"""This is the analysis directory for run '{run.name}' of project '{self.info.name}'.
 
 The following files have been automatically generated:
 
 - 'flowcell_basecalls.tsv': TSV file listing information about flow cells and
   basecalls directories
-""")
-                if os.path.exists(os.path.join(run_dir, "samples.tsv")):
-                    read_me.write(
-                        "- 'samples.tsv': TSV file matching sample names to flow cell "
-                        "and barcode IDs\n")
-                read_me.write(
-                    f"- copies of HTML reports from the basecalling runs found in "
-                    "the primary data directory (renamed to identify the associated "
-                    "locations).")
+"""]
+            if os.path.exists(samples_file):
+                read_me.append(
+                    "- 'samples.tsv': TSV file matching sample names to flow cell "
+                    "and barcode IDs\n")
+            read_me.append(
+                "- copies of HTML reports from the basecalling runs found in "
+                "the primary data directory (renamed to identify the associated "
+                "locations).")
+            with open(read_me_file, "wt") as fp:
+                fp.write("".join(read_me))
             # Add run to list of run_dirs
             self.run_dirs[run.name] = os.path.basename(run_dir)
         # Update the 'runs' field in the project info
@@ -440,10 +503,14 @@ The following files have been automatically generated:
 
         Arguments:
             fields (str): optional, comma separated list of fields
+              (or a list of field names which have already been
+              split)
             most_recent (int): optional, number of most recent
             runs to report
         """
-        fields = [f.strip() for f in fields.split(',')]
+        if isinstance(fields, str):
+            fields = fields.split(',')
+        fields = [f.strip() for f in fields]
         output = []
         if not most_recent:
             # Report all runs
@@ -486,7 +553,7 @@ The following files have been automatically generated:
         - primary_data (path to primary data)
         - analysis_dir (path to the analysis directory)
         - comments (associated comments)
-        - null (empty value)
+        - null (empty value; the only case-insensitive field)
 
         Composite fields can be specified using the syntax
 
@@ -529,103 +596,128 @@ The following files have been automatically generated:
             # Return composite value
             return delimiter.join([str(x) for x in value])
         # Single field specified
-        fmt_func = fmt_value
-        if field == "" or field.lower() == "null":
-            value = ''
-        elif field == "name":
-            value = self.info.name
-        elif field == "id":
-            value = self.info.id
-        elif field == "datestamp":
-            value = self.datestamp()
-        elif field == "datestamp_short":
-            value = self.datestamp_short()
-        elif field == "run_datestamp":
-            if run is None:
-                raise KeyError(f"'{field}' field requires a run name")
-            value = self.datestamp(run)
-        elif field == "run_datestamp_short":
-            if run is None:
-                raise KeyError(f"'{field}' field requires a run name")
-            value = self.datestamp_short(run)
-        elif field == "run":
-            if run is None:
-                raise KeyError(f"'{field}' field requires a run name")
-            value = run
-        elif field == "runs":
-            value = ",".join(self.runs)
-        elif field == "nruns" or field == "#runs":
-            value = len(self.runs)
-        elif field == "platform":
-            value = self.info.platform
-        elif field == "user":
-            value = self.info.user
-        elif field == "pi":
-            value = self.info.PI
-        elif field == "application":
-            value = self.info.application
-        elif field == "organism":
-            value = self.info.organism
-        elif field == "nsamples" or field == "#samples":
-            if run is None:
-                runs = self.runs
-            elif run in self.runs:
-                runs = [run]
-            else:
-                raise KeyError("%s: unrecognised run name" % run)
-            # Get total number of samples across all runs
-            value = 0
-            for r in runs:
-                samples_file = os.path.join(self.path, self.run_dirs[r], "samples.tsv")
-                if os.path.exists(samples_file):
-                    value += len(SamplesInfo(samples_file))
-            def fmt_func(s): return '?' if s == "" else s
-        elif field == 'sample_names' or field == 'samples':
-            if run is None:
-                runs = self.runs
-            elif run in self.runs:
-                runs = [run]
-            else:
-                raise KeyError("%s: unrecognised run name" % run)
-            sample_names = []
-            for r in runs:
-                sample_names.extend([s["Sample"] for s in SamplesInfo(os.path.join(self.path,
-                                                                                   self.run_dirs[r],
-                                                                                   "samples.tsv"))])
-            value = ",".join(sample_names)
-        elif field == "primary_data":
-            value = self.info.data_dir
-        elif field == "analysis_dir":
-            value = self.path
-        elif field == "comments":
-            value = self.info.comments
-            def fmt_func(s): return '' if s is None else str(s)
-        else:
-            # Look for custom data items for run
-            got_value = False
-            if run:
-                # Check run metadata
-                run_info_file = os.path.join(self.path,
-                                             self.run_dirs[run],
-                                             "run.info")
-                if os.path.exists(run_info_file):
-                    try:
-                        value = RunInfo(run_info_file,
-                                        custom_items=self._custom_run_metadata_items)[field]
-                        got_value = True
-                    except KeyError:
-                        pass
-            if not got_value:
-                # Check project metadata
+        # NB only 'null' is case-insensitive
+        if field.lower() == "null":
+            field = "null"
+        report_field = _REPORT_FIELDS.get(field)
+        if report_field is None:
+            # Look for custom data items
+            return fmt_value(self._get_custom_value(field, run))
+        get_func, fmt_func = report_field
+        return fmt_func(get_func(self, run))
+
+    def _get_custom_value(self, field, run=None):
+        """
+        Internal: get value of a custom metadata field
+
+        Checks the run metadata (if a run is specified) and
+        then the project metadata for a matching item.
+
+        Arguments:
+          field (str): name of the field to retrieve
+          run (str): optional, specifies run to get value
+            associated with field
+
+        Raises:
+          KeyError: if the field doesn't match any of the
+            metadata items.
+        """
+        if run:
+            # Check run metadata
+            run_info_file = os.path.join(self.path,
+                                         self.run_dirs[run],
+                                         "run.info")
+            if os.path.exists(run_info_file):
                 try:
-                    value = self.info[field]
-                    got_value = True
+                    return RunInfo(run_info_file,
+                                   custom_items=self._custom_run_metadata_items)[field]
                 except KeyError:
                     pass
-            if not got_value:
-                # No matching metadata
-                raise KeyError("%s: unrecognised field" % field)
-        return fmt_func(value)
+        # Check project metadata
+        try:
+            return self.info[field]
+        except KeyError:
+            pass
+        # No matching metadata
+        raise KeyError("%s: unrecognised field" % field)
+
+    def _get_run(self, field, run):
+        """
+        Internal: check that a run name has been supplied
+
+        Arguments:
+          field (str): name of the field requiring the run
+          run (str): run name to check
+
+        Raises:
+          KeyError: if the run name is not set.
+        """
+        if run is None:
+            raise KeyError(f"'{field}' field requires a run name")
+        return run
+
+    def _get_runs(self, run=None):
+        """
+        Internal: return list of runs to get sample data for
+
+        Arguments:
+          run (str): optional, if set then only return this
+            run (otherwise all runs are returned)
+
+        Raises:
+          KeyError: if the run name is not recognised.
+        """
+        if run is None:
+            return self.runs
+        elif run in self.runs:
+            return [run]
+        raise KeyError("%s: unrecognised run name" % run)
+
+    def _get_nsamples(self, run=None):
+        """
+        Internal: get total number of samples in project or run
+        """
+        value = 0
+        for r in self._get_runs(run):
+            value += len(self._get_samples_info(r))
+        return value
+
+    def _get_sample_names(self, run=None):
+        """
+        Internal: get comma-separated sample names for project or run
+        """
+        sample_names = []
+        for r in self._get_runs(run):
+            sample_names.extend(s["Sample"] for s in self._get_samples_info(r))
+        return ",".join(sample_names)
+
+    def _get_samples_info(self, run):
+        """
+        Internal: get samples information for a run
+
+        The 'samples.tsv' file for the run is only read the
+        first time the information is requested; subsequent
+        requests return the same SamplesInfo instance.
+
+        Arguments:
+          run (str): name of run to get samples for
+
+        Returns:
+          SamplesInfo: samples information for the run (will
+            be empty if the run has no 'samples.tsv' file).
+        """
+        try:
+            return self._samples_info[run]
+        except KeyError:
+            pass
+        samples_file = os.path.join(self.path, self.run_dirs[run], "samples.tsv")
+        if os.path.exists(samples_file):
+            samples_info = SamplesInfo(samples_file)
+        else:
+            logger.debug("%s: no 'samples.tsv' file found", run)
+            samples_info = SamplesInfo()
+        self._samples_info[run] = samples_info
+        return samples_info
 
     def datestamp(self, run=None):
         """
@@ -663,10 +755,7 @@ The following files have been automatically generated:
                     if datestamp:
                         # Only add non-empty values
                         datestamps.add(datestamp)
-        try:
-            return sorted(list(datestamps))[0]
-        except IndexError:
-            return None
+        return min(datestamps, default=None)
 
     def datestamp_short(self, run=None):
         """
@@ -693,16 +782,23 @@ The following files have been automatically generated:
             return datestamp
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _make_project_id(name):
         """
         Internal: generates a project ID
 
         Arguments:
           name (str): project name to generate ID from
+
+        Raises:
+          ValueError: if the name is not a valid PromethION
+            project name.
         """
         # Expect name of the form "PromethION_Project_009_PerGynt"
-        project_number = RE_PROJECT_DIR_NAME.match(name).group(1)
-        return f"PROMETHION#{project_number}"
+        m = RE_PROJECT_DIR_NAME.match(name)
+        if not m:
+            raise ValueError(f"{name}: not a PromethION project name")
+        return f"PROMETHION#{m.group(1)}"
 
 
 class ProjectInfo(MetadataDict):
@@ -744,48 +840,34 @@ class ProjectInfo(MetadataDict):
         metadata items
     """
 
+    # Core metadata items
+    DATA_ITEMS = {
+        "name": "Project name",
+        "id": "Project ID",
+        "platform": "Platform",
+        "user": "User",
+        "PI": "PI",
+        "application": "Application",
+        "organism": "Organism",
+        "runs": "Runs",
+        "data_dir": "Data directory",
+        "comments": "Comments",
+    }
+    ORDER = ("name",
+             "id",
+             "platform",
+             "user",
+             "PI",
+             "application",
+             "organism",
+             "runs",
+             "data_dir",
+             "comments",)
+
     def __init__(self, filein=None, custom_items=None):
-        # Core metadata
-        data_items = {
-            "name": "Project name",
-            "id": "Project ID",
-            "platform": "Platform",
-            "user": "User",
-            "PI": "PI",
-            "application": "Application",
-            "organism": "Organism",
-            "runs": "Runs",
-            "data_dir": "Data directory",
-            "comments": "Comments",
-        }
-        order = [ "name",
-                  "id",
-                  "platform",
-                  "user",
-                  "PI",
-                  "application",
-                  "organism",
-                  "runs",
-                  "data_dir",
-                  "comments", ]
-        # Additional custom items
-        if custom_items:
-            for item in custom_items:
-                # Create a name for writing to file, by replacing
-                # underscores with spaces and then capitalizing
-                # e.g. "order_number" -> "Order number"
-                # Check custom item name
-                if item[0].isdigit():
-                    raise Exception(f"'{item}': metadata items must not start with a number")
-                if any([not (c.isalnum() or c == "_") for c in item]):
-                    raise Exception(f"'{item}': metadata items must only contain letters and underscores")
-                if item[0].isupper() and not any([c.isupper() if c.isalpha() else False for c in item[1:]]):
-                    raise Exception(f"'{item}': metadata items cannot be capitalized (use '{item.lower()}' instead)")
-                name = item_to_name(item)
-                if item in data_items:
-                    raise Exception(f"Custom metadata item '{item}' duplicates an existing item")
-                data_items[item] = name
-                order.append(item)
+        data_items, order = _add_custom_items(self.DATA_ITEMS,
+                                              self.ORDER,
+                                              custom_items)
         MetadataDict.__init__(self,
                               attributes=data_items,
                               order=order,
@@ -799,30 +881,16 @@ class RunInfo(MetadataDict):
     Class for storing and handling run info
     """
 
+    # Core metadata items
+    DATA_ITEMS = {
+        "name": "Run name",
+    }
+    ORDER = ("name",)
+
     def __init__(self, filein=None, custom_items=None):
-        # Core metadata items
-        data_items = {
-            "name": "Run name",
-        }
-        order = [ "name",]
-        # Additional custom items
-        if custom_items:
-            for item in custom_items:
-                # Create a name for writing to file, by replacing
-                # underscores with spaces and then capitalizing
-                # e.g. "order_number" -> "Order number"
-                # Check custom item name
-                if item[0].isdigit():
-                    raise Exception(f"'{item}': metadata items must not start with a number")
-                if any([not (c.isalnum() or c == "_") for c in item]):
-                    raise Exception(f"'{item}': metadata items must only contain letters and underscores")
-                if item[0].isupper() and not any([c.isupper() if c.isalpha() else False for c in item[1:]]):
-                    raise Exception(f"'{item}': metadata items cannot be capitalized (use '{item.lower()}' instead)")
-                name = item_to_name(item)
-                if item in data_items:
-                    raise Exception(f"Custom metadata item '{item}' duplicates an existing item")
-                data_items[item] = name
-                order.append(item)
+        data_items, order = _add_custom_items(self.DATA_ITEMS,
+                                              self.ORDER,
+                                              custom_items)
         MetadataDict.__init__(self,
                               attributes=data_items,
                               order=order,
@@ -831,6 +899,46 @@ class RunInfo(MetadataDict):
                               include_undefined=True)
 
 
+def _add_custom_items(data_items, order, custom_items=None):
+    """
+    Internal: combine core and custom metadata items
+
+    Returns new copies of the core data items and order,
+    extended with any additional custom items (so that the
+    core definitions are never modified).
+
+    Arguments:
+      data_items (dict): core metadata items mapped to
+        the names used when writing to file
+      order (sequence): core metadata items in order
+      custom_items (list): optional list of extra custom
+        metadata items
+
+    Returns:
+      Tuple: (data_items, order) with custom items added.
+    """
+    data_items = dict(data_items)
+    order = list(order)
+    if custom_items:
+        for item in custom_items:
+            # Create a name for writing to file, by replacing
+            # underscores with spaces and then capitalizing
+            # e.g. "order_number" -> "Order number"
+            # Check custom item name
+            if item[0].isdigit():
+                raise Exception(f"'{item}': metadata items must not start with a number")
+            if any([not (c.isalnum() or c == "_") for c in item]):
+                raise Exception(f"'{item}': metadata items must only contain letters and underscores")
+            if item[0].isupper() and not any([c.isupper() if c.isalpha() else False for c in item[1:]]):
+                raise Exception(f"'{item}': metadata items cannot be capitalized (use '{item.lower()}' instead)")
+            name = item_to_name(item)
+            if item in data_items:
+                raise Exception(f"Custom metadata item '{item}' duplicates an existing item")
+            data_items[item] = name
+            order.append(item)
+    return (data_items, order)
+
+
 class SamplesInfo(MetadataTabFile):
     """
     Class for handling and storing information about samples
@@ -946,19 +1054,24 @@ class FlowcellBasecallsInfo(TabFile):
         base calls information from
     """
 
+    # Fields (columns) and the corresponding keywords
+    _FIELDS = ("Run",
+               "SubDir",
+               "FlowCellID",
+               "Reports",
+               "Kit",
+               "Modifications",
+               "TrimBarcodes",
+               "MinknowVersion",
+               "BasecallingModel",
+               "FileTypes")
+    _KWS = tuple([convert_field_name(f) for f in _FIELDS])
+    _KWS_SET = frozenset(_KWS)
+
     def __init__(self, filein=None):
-        self._fields = ("Run",
-                        "SubDir",
-                        "FlowCellID",
-                        "Reports",
-                        "Kit",
-                        "Modifications",
-                        "TrimBarcodes",
-                        "MinknowVersion",
-                        "BasecallingModel",
-                        "FileTypes")
-        self._kws = tuple([convert_field_name(f)
-                           for f in self._fields])
+        self._fields = self._FIELDS
+        self._kws = self._KWS
+        self._kws_set = self._KWS_SET
         TabFile.__init__(self,
                          column_names=self._fields,
                          first_line_is_header=True,
@@ -973,9 +1086,12 @@ class FlowcellBasecallsInfo(TabFile):
             can be any of the allowed data fields
         """
         for k in kws:
-            if k not in self._kws:
+            if k not in self._kws_set:
                 raise KeyError("'%s': unrecognised field" % k)
-        data = [kws[k] if k in kws else None for k in self._kws]
+        # Values such as kit names, versions and 'none' repeat
+        # across entries, so intern strings to share them
+        data = [sys.intern(v) if isinstance(v, str) else v
+                for v in (kws.get(k) for k in self._kws)]
         self.append(data)
 
     def save(self, fileout):
@@ -5,29 +5,25 @@
 #
 
 import os
+import sys
+import signal
 import tempfile
 import shutil
 from argparse import ArgumentParser
-from auto_process_ngs.command import Command
-from auto_process_ngs.fileops import copy
-from auto_process_ngs.fileops import set_group
-from auto_process_ngs.fileops import set_permissions
-from bcftbx.JobRunner import fetch_runner
-from bcftbx.JobRunner import BaseJobRunner
-from .analysis import ProjectAnalysisDir
-from .analysis import RunInfo
-from .nanopore.promethion import BasecallsMetadata
-from .nanopore.promethion import ProjectDir
-from .settings import Settings
-from .utils import execute_command
-from .utils import fmt_value
-from .utils import fmt_yes_no
+from functools import lru_cache
 from . import get_version
 
+# NB imports of the other bcf_nanopore modules and the
+# auto_process_ngs/bcftbx libraries are deferred to the functions
+# where they're used, to reduce the start-up time for each command
 
 # File types
 FILE_TYPES = [ "POD5", "FASTQ", "BAM" ]
-FILE_TYPES_LOWER = [t.lower() for t in FILE_TYPES]
+FILE_TYPES_LOWER = frozenset([t.lower() for t in FILE_TYPES])
+
+# Default fields for reporting in "runs" mode
+DEFAULT_REPORT_FIELDS = "name,id,run,NULL,NULL,user,pi,application," \
+                        "organism,NULL,#samples,samples"
 
 
 def get_settings():
@@ -38,6 +34,7 @@ def get_settings():
       Settings: a Settings instance with the default
         configuration parameters loaded
     """
+    from .settings import Settings
     return Settings()
 
 
@@ -60,7 +57,7 @@ def get_reporting_templates(settings=None):
     if settings is None:
         settings = get_settings()
     templates = {}
-    for t in [t for t in settings.reporting_templates]:
+    for t in settings.reporting_templates:
         templates[t] = settings.reporting_templates[t]
     return templates
 
@@ -102,6 +99,7 @@ def config():
     """
     Print configuration information
     """
+    from .settings import Settings
     settings = Settings(resolve_undefined=True)
     print(settings.report_settings(exclude_undefined=False))
 
@@ -116,90 +114,85 @@ def info(project_dir):
     Arguments:
       project_dir (str): path to the top-level PromethION
         project directory
+
+    Returns:
+      Integer: 0 on success, 1 if no flow cells or basecalls
+        directories were found in the project.
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from .nanopore.promethion import ProjectDir
+    from .utils import fmt_value
     # Top level
     project = ProjectDir(os.path.abspath(project_dir))
+    if not project.runs:
+        # Runs are only included if they have flow cells or
+        # basecalls directories
+        sys.stderr.write(f"{project_dir}: no flow cells or basecalls "
+                         f"directories found\n")
+        return 1
     # Make a metadata file
-    print('\t'.join(["#Run",
-                     "SubDir",
-                     "FlowCellID",
-                     "Reports",
-                     "Kit",
-                     "Modifications",
-                     "TrimBarcodes",
-                     "MinKNOWVersion",
-                     "BasecallingModel",
-                     "FileTypes"]))
+    # NB lines are collected and written in one go at the end
+    lines = ['\t'.join(["#Run",
+                         "SubDir",
+                         "FlowCellID",
+                         "Reports",
+                         "Kit",
+                         "Modifications",
+                         "TrimBarcodes",
+                         "MinKNOWVersion",
+                         "BasecallingModel",
+                         "FileTypes"])]
+    def info_line(job):
+        # Generate 'info' line for a flow cell or basecalls dir
+        run_name, d, is_flow_cell = job
+        md = d.metadata
+        if is_flow_cell:
+            flow_cell_id = d.id
+        else:
+            flow_cell_id = fmt_value(md.flow_cell_id)
+        kit = fmt_value(md.kit)
+        modifications = ("none" if md.modified_basecalling == "Off"
+                         else fmt_value(md.modifications))
+        trim_barcodes = fmt_value(md.trim_barcodes)
+        # NB software versions may not be set
+        minknow_version = (md.software_versions or {}).get("minknow", "?")
+        reports = d.report_types
+        if reports:
+            reports = ",".join(reports)
+        else:
+            reports = "none"
+        file_types = d.file_types
+        if file_types:
+            file_types = ",".join(file_types)
+        else:
+            file_types = "none"
+        basecalling_model = md.basecalling_model
+        if basecalling_model is None:
+            basecalling_model = md.basecalling_config
+        basecalling_model = fmt_value(basecalling_model)
+        return '\t'.join([str(s) for s in (run_name,
+                                           os.path.relpath(d.path,
+                                                           project.path),
+                                           flow_cell_id,
+                                           reports,
+                                           kit,
+                                           modifications,
+                                           trim_barcodes,
+                                           minknow_version,
+                                           basecalling_model,
+                                           file_types)])
+    jobs = []
     for run in project.runs:
-        for fc in run.flow_cells:
-            kit = fmt_value(fc.metadata.kit)
-            modifications = ("none" if fc.metadata.modified_basecalling == "Off"
-                             else fmt_value(fc.metadata.modifications))
-            trim_barcodes = fmt_value(fc.metadata.trim_barcodes)
-            try:
-                minknow_version = fc.metadata.software_versions["minknow"]
-            except (TypeError, KeyError):
-                minknow_version = "?"
-            reports = fc.report_types
-            if reports:
-                reports = ",".join(reports)
-            else:
-                reports = "none"
-            file_types = fc.file_types
-            if file_types:
-                file_types = ",".join(file_types)
-            else:
-                file_types = "none"
-            basecalling_model = fc.metadata.basecalling_model
-            if basecalling_model is None:
-                basecalling_model = fc.metadata.basecalling_config
-            basecalling_model = fmt_value(basecalling_model)
-            print('\t'.join([str(s) for s in (run.name,
-                                              os.path.relpath(fc.path,
-                                                              project.path),
-                                              fc.id,
-                                              reports,
-                                              kit,
-                                              modifications,
-                                              trim_barcodes,
-                                              minknow_version,
-                                              basecalling_model,
-                                              file_types)]))
-        for bc in run.basecalls_dirs:
-            flow_cell_id = fmt_value(bc.metadata.flow_cell_id)
-            kit = fmt_value(bc.metadata.kit)
-            modifications = ("none" if bc.metadata.modified_basecalling == "Off"
-                             else fmt_value(bc.metadata.modifications))
-            trim_barcodes = fmt_value(bc.metadata.trim_barcodes)
-            try:
-                minknow_version = bc.metadata.software_versions["minknow"]
-            except (TypeError, KeyError):
-                minknow_version = "?"
-            reports = bc.report_types
-            if reports:
-                reports = ",".join(reports)
-            else:
-                reports = "none"
-            file_types = bc.file_types
-            if file_types:
-                file_types = ",".join(file_types)
-            else:
-                file_types = "none"
-            basecalling_model = bc.metadata.basecalling_model
-            if basecalling_model is None:
-                basecalling_model = bc.metadata.basecalling_config
-            basecalling_model = fmt_value(basecalling_model)
-            print('\t'.join([str(s) for s in (run.name,
-                                              os.path.relpath(bc.path,
-                                                              project.path),
-                                              flow_cell_id,
-                                              reports,
-                                              kit,
-                                              modifications,
-                                              trim_barcodes,
-                                              minknow_version,
-                                              basecalling_model,
-                                              file_types)]))
+        jobs.extend([(run.name, fc, True) for fc in run.flow_cells])
+        jobs.extend([(run.name, bc, False) for bc in run.basecalls_dirs])
+    # Collecting the metadata is I/O bound (reading reports etc)
+    # so use a thread pool to overlap the filesystem access
+    # NB 'map' returns the results in the same order as the jobs
+    with ThreadPoolExecutor(
+            max_workers=min(len(jobs), 32)) as executor:
+        lines.extend(executor.map(info_line, jobs))
+    print('\n'.join(lines))
+    return 0
 
 
 def extract_metadata(metadata_file, dump_json=False):
@@ -213,31 +206,26 @@ def extract_metadata(metadata_file, dump_json=False):
         (default) then only print extract metadata items;
         otherwise dump the extract JSON data
     """
+    from .nanopore.promethion import BasecallsMetadata
     data = BasecallsMetadata()
     data.load_from_report(metadata_file)
     if metadata_file.endswith(".html"):
         if dump_json:
-            try:
-                print(data.html_json())
-            except BrokenPipeError:
-                pass
+            print(data.html_json())
         else:
-            print("Flow cell ID         : %s" % data.flow_cell_id)
-            print("Flow cell type       : %s" % data.flow_cell_type)
-            print("Kit type             : %s" % data.kit)
-            print("Modified basecalling : %s" % data.modified_basecalling)
-            print("Modified base context: %s" % data.modifications)
-            print("Barcode trimming     : %s" % data.trim_barcodes)
-            print("Software versions    : %s" % data.software_versions)
+            print(f"Flow cell ID         : {data.flow_cell_id}\n"
+                  f"Flow cell type       : {data.flow_cell_type}\n"
+                  f"Kit type             : {data.kit}\n"
+                  f"Modified basecalling : {data.modified_basecalling}\n"
+                  f"Modified base context: {data.modifications}\n"
+                  f"Barcode trimming     : {data.trim_barcodes}\n"
+                  f"Software versions    : {data.software_versions}")
     elif metadata_file.endswith(".json"):
         if dump_json:
-            try:
-                print(data.json())
-            except BrokenPipeError:
-                pass
+            print(data.json())
         else:
-            print("Basecalling model    : %s" % data.basecalling_model)
-            print("Basecalling config   : %s" % data.basecalling_config)
+            print(f"Basecalling model    : {data.basecalling_model}\n"
+                  f"Basecalling config   : {data.basecalling_config}")
 
 
 def setup(project_dir, user, PI, application=None, organism=None, top_dir=None,
@@ -260,6 +248,9 @@ def setup(project_dir, user, PI, application=None, organism=None, top_dir=None,
       group (str): update the filesystem group associated
         with the analysis directory to the supplied group name
     """
+    from auto_process_ngs.fileops import set_group
+    from auto_process_ngs.fileops import set_permissions
+    from .analysis import ProjectAnalysisDir
     custom_project_metadata_items, custom_run_metadata_items = get_custom_metadata_items()
     # Read source project data
     project_name = os.path.basename(os.path.normpath(project_dir))
@@ -269,7 +260,7 @@ def setup(project_dir, user, PI, application=None, organism=None, top_dir=None,
     top_dir = os.path.abspath(top_dir)
     analysis_dir = ProjectAnalysisDir(
         os.path.join(top_dir,
-                     "%s_analysis" % project_name),
+                     f"{project_name}_analysis"),
         custom_project_metadata_items=custom_project_metadata_items,
         custom_run_metadata_items=custom_run_metadata_items)
     analysis_dir.create(project_dir,
@@ -298,6 +289,9 @@ def update(path, project_dir, permissions=None, group=None):
       group (str): update the filesystem group associated
         with the analysis directory to the supplied group name
     """
+    from auto_process_ngs.fileops import set_group
+    from auto_process_ngs.fileops import set_permissions
+    from .analysis import ProjectAnalysisDir
     custom_project_metadata_items, custom_run_metadata_items = get_custom_metadata_items()
     # Read in data from the analysis directory
     analysis_dir = ProjectAnalysisDir(path,
@@ -323,6 +317,8 @@ def metadata(path, items=None, update=False):
         update (bool): if True then update items in legacy metadata
           files
     """
+    from .analysis import ProjectAnalysisDir
+    from .analysis import RunInfo
     # Get configuration settings
     custom_project_metadata_items, custom_run_metadata_items = get_custom_metadata_items()
     # Read in data
@@ -406,9 +402,11 @@ def report(path, mode="summary", fields=None, template=None, out_file=None,
       most_recent (int): optional, only report this number of most
         recent runs (default is report all runs)
     """
+    from auto_process_ngs.fileops import Location
+    from auto_process_ngs.fileops import copy
+    from .analysis import ProjectAnalysisDir
     # Get configuration settings
     custom_project_metadata_items, custom_run_metadata_items = get_custom_metadata_items()
-    reporting_templates = get_reporting_templates()
     # Read in data
     analysis_dir = ProjectAnalysisDir(path,
                                       custom_project_metadata_items=custom_project_metadata_items,
@@ -420,12 +418,13 @@ def report(path, mode="summary", fields=None, template=None, out_file=None,
         # Set fields
         if fields is None:
             # Default fields
-            fields = "name,id,run,NULL,NULL,user,pi,application,organism,NULL,#samples,samples"
+            fields = DEFAULT_REPORT_FIELDS
         if template:
-            try:
-                fields = reporting_templates[template]
-            except KeyError:
+            fields = get_reporting_templates().get(template)
+            if fields is None:
                 raise Exception("%s: undefined template" % template)
+        # Split into individual field names
+        fields = fields.split(",")
         # Report
         report_text = analysis_dir.report_project_runs(fields, most_recent=most_recent)
     else:
@@ -433,22 +432,30 @@ def report(path, mode="summary", fields=None, template=None, out_file=None,
     if out_file:
         # File extension for report file
         ext = "tsv" if mode == "runs" else "txt"
-        # Temporary copy
-        temp_dir = tempfile.mkdtemp()
-        temp_file = os.path.join(temp_dir,
-                                 f"{analysis_dir.info.id.lower()}.{ext}")
-        with open(temp_file, "wt") as fp:
-            fp.write(report_text + '\n')
-        # Copy to final location
-        copy(temp_file, str(out_file))
-        shutil.rmtree(temp_dir)
+        report_name = f"{analysis_dir.info.id.lower()}.{ext}"
+        if not Location(str(out_file)).is_remote:
+            # Write directly to local destination
+            out_path = str(out_file)
+            if os.path.isdir(out_path):
+                out_path = os.path.join(out_path, report_name)
+            with open(out_path, "wt") as fp:
+                fp.write(report_text + '\n')
+        else:
+            # Temporary copy
+            temp_dir = tempfile.mkdtemp()
+            temp_file = os.path.join(temp_dir, report_name)
+            with open(temp_file, "wt") as fp:
+                fp.write(report_text + '\n')
+            # Copy to final (remote) location
+            copy(temp_file, str(out_file))
+            shutil.rmtree(temp_dir)
         print(f"Written to {out_file}")
     else:
         print(report_text)
 
 
 def fetch(project_dir, target_dir, file_types=None, dry_run=False,
-          runner=None, permissions=None, group=None):
+          runner=None, permissions=None, group=None, verbose=False):
     """
     Fetch the BAM files and reports for a Promethion run
 
@@ -469,7 +476,15 @@ def fetch(project_dir, target_dir, file_types=None, dry_run=False,
         mode (e.g. 'g+w')
       group (str): update the filesystem group associated
         with the copied files to the supplied group name
+      verbose (bool): if True then also report the full
+        rsync command line (default is to only report the
+        source and destination)
     """
+    from auto_process_ngs.command import Command
+    from auto_process_ngs.fileops import set_group
+    from bcftbx.JobRunner import fetch_runner
+    from bcftbx.JobRunner import BaseJobRunner
+    from .utils import execute_command
     # Clean the project dir path
     project_dir = project_dir.rstrip(os.sep)
     # Project name
@@ -478,72 +493,66 @@ def fetch(project_dir, target_dir, file_types=None, dry_run=False,
     if runner is not None and not isinstance(runner, BaseJobRunner):
             runner = fetch_runner(runner)
     print(f"Using job runner '{runner}'")
-    # File types to include
+    # File types to include (normalised and with duplicates
+    # and empty values removed)
+    if file_types:
+        file_types = set([t.strip().lower() for t in file_types
+                          if t.strip()])
     if not file_types:
-        file_types = ["bam"]
-    for t in file_types:
-        if t.lower() not in FILE_TYPES_LOWER:
-            raise Exception(f"fetch: unknown file type requested: "
-                            f"'{t}'")
-    file_types = [t.lower() for t in file_types]
-    # Example rsync to only fetch BAM and index files:
-    # rsync --dry-run -av -m --include="*/" \
+        file_types = set(["bam"])
+    unknown_file_types = file_types - FILE_TYPES_LOWER
+    if unknown_file_types:
+        raise Exception("fetch: unknown file type requested: " +
+                        ", ".join([f"'{t}'"
+                                   for t in sorted(unknown_file_types)]))
+    # Fetch the data files plus reports, sample sheets and
+    # summaries in a single rsync (so that the source is only
+    # scanned once), e.g. to only fetch BAM and index files:
+    # rsync --dry-run -av -m -W --include="*/" \
     # --include="bam_pass/**.bam" --include="bam_pass/**.bai" \
     # --include="pass/**.bam" --include="pass/**.bai" \
+    # --include="report_*" --include="sample_sheet_*" \
+    # --include="sequencing_summary*.txt" \
     # --exclude="*" \
     # <PromethION_PROJECT_DIR> .
-    rsync_data = Command('rsync')
-    if dry_run:
-        rsync_data.add_args("--dry-run")
-    rsync_data.add_args("-av",
-                        "-m",
-                        "--include=*/")
+    # NB use whole-file transfers ('-W') as the data files are
+    # not modified once written, so rsync's delta-transfer
+    # checksumming is wasted effort
+    rsync_args = ["--dry-run"] if dry_run else []
+    rsync_args.extend(("-av",
+                       "-m",
+                       "-W",
+                       "--include=*/"))
     if "pod5" in file_types:
-        rsync_data.add_args(
-            "--include=pod5/**.pod5")
+        rsync_args.extend((
+            "--include=pod5/**.pod5",))
     if "fastq" in file_types:
-        rsync_data.add_args(
+        rsync_args.extend((
             "--include=fastq_pass/**.fastq",
             "--include=fastq_pass/**.fastq.gz",
             "--include=pass/**.fastq",
-            "--include=pass/**.fastq.gz")
+            "--include=pass/**.fastq.gz"))
     if "bam" in file_types:
-        rsync_data.add_args(
+        rsync_args.extend((
             "--include=bam_pass/**.bam",
             "--include=bam_pass/**.bai",
             "--include=pass/**.bam",
-            "--include=pass/**.bai")
-    rsync_data.add_args("--exclude=*")
-    if permissions:
-        rsync_data.add_args(f"--chmod={permissions}")
-    rsync_data.add_args(project_dir,
-                        target_dir)
-    print("Transferring data files with command: %s" % rsync_data)
-    status = execute_command(rsync_data, runner=runner)
-    if status != 0:
-        raise Exception("fetch: failed to transfer data")
-    # Example to fetch reports, sample sheets and summaries:
-    # rsync --dry-run -av -m --include="*/" --include="report_*" \
-    # --include="sample_sheet_*" --include="sequencing_summary*.txt" \
-    # --exclude="*" <PromethION_PROJECT_DIR> .
-    rsync_reports = Command('rsync')
-    if dry_run:
-        rsync_reports.add_args('--dry-run')
-    rsync_reports.add_args('-av',
-                           '-m',
-                           '--include=*/',
-                           '--include=report_*',
-                           '--include=sample_sheet_*',
-                           '--include=sequencing_summary*.txt',
-                           '--exclude=*')
+            "--include=pass/**.bai"))
+    rsync_args.extend(("--include=report_*",
+                       "--include=sample_sheet_*",
+                       "--include=sequencing_summary*.txt",
+                       "--exclude=*"))
     if permissions:
-        rsync_reports.add_args(f"--chmod={permissions}")
-    rsync_reports.add_args(project_dir,
-                           target_dir)
-    print("Transferring report files with command: %s" % rsync_reports)
-    status = execute_command(rsync_reports, runner=runner)
+        rsync_args.append(f"--chmod={permissions}")
+    rsync = Command('rsync', *rsync_args, project_dir, target_dir)
+    if verbose:
+        print("Transferring data and report files with command: %s" % rsync)
+    else:
+        print(f"Transferring data and report files from {project_dir} "
+              f"to {target_dir}")
+    status = execute_command(rsync, runner=runner)
     if status != 0:
-        raise Exception("fetch: failed to transfer reports")
+        raise Exception("fetch: failed to transfer data and reports")
     # Set the group
     if group is not None:
         print(f"Setting group on copied files to '{group}'")
@@ -551,33 +560,60 @@ def fetch(project_dir, target_dir, file_types=None, dry_run=False,
             set_group(group, os.path.join(target_dir, project_name))
 
 
-def bcf_nanopore_main():
+def _sniff_command(argv):
+    """
+    Internal: identify the command from the command line
 
-    # Defaults
-    settings = get_settings()
-    default_permissions = settings.general.permissions
-    default_group = settings.general.group
+    The command is the first argument which isn't an option
+    (the only top-level option is '--version', which doesn't
+    take a value).
 
-    # Main parser
-    p = ArgumentParser()
-    sp = p.add_subparsers(dest='command')
+    Arguments:
+      argv (list): command line arguments (excluding the
+        program name)
+
+    Returns:
+      String: the command name, or None if no command
+        was found.
+    """
+    for arg in argv:
+        if not arg.startswith('-'):
+            return arg
+    return None
 
-    # Version
-    p.add_argument('--version', action='version',
-                   version=("%%(prog)s %s" % get_version()))
 
-    # Config command
-    config_cmd = sp.add_parser("config",
-                               help="Print configuration information")
+def _add_config_parser(sp):
+    """
+    Internal: add parser for the 'config' command
 
-    # Info command
+    Arguments:
+      sp (object): subparsers object to add the parser to
+    """
+    sp.add_parser("config",
+                  help="Print configuration information")
+
+
+def _add_info_parser(sp):
+    """
+    Internal: add parser for the 'info' command
+
+    Arguments:
+      sp (object): subparsers object to add the parser to
+    """
     info_cmd = sp.add_parser("info",
                              help="Get information on a Promethion project "
                              "directory")
     info_cmd.add_argument('project_dir',
                           help="top level PromethION project directory")
 
-    # Extract_metadata command
+
+def _add_extract_metadata_parser(sp):
+    """
+    Internal: add parser for the 'extract_metadata' command
+
+    Arguments:
+      sp (object): subparsers object to add the parser to
+    """
     md_cmd = sp.add_parser("extract_metadata",
                            help="Extract metadata from HTML or JSON report")
     md_cmd.add_argument('file',
@@ -586,7 +622,18 @@ def bcf_nanopore_main():
                         help="dump extracted JSON data instead of metadata "
                         "items")
 
-    # Setup command
+
+def _add_setup_parser(sp, settings):
+    """
+    Internal: add parser for the 'setup' command
+
+    Arguments:
+      sp (object): subparsers object to add the parser to
+      settings (function): function returning the configuration
+        settings (used to set default values)
+    """
+    default_permissions = settings().general.permissions
+    default_group = settings().general.group
     setup_cmd = sp.add_parser("setup",
                               help="Set up a new analysis directory for a "
                               "Promethion project")
@@ -619,7 +666,18 @@ def bcf_nanopore_main():
                            (f"'{default_group}'" if default_group
                             else "don't set group",))
 
-    # Update command
+
+def _add_update_parser(sp, settings):
+    """
+    Internal: add parser for the 'update' command
+
+    Arguments:
+      sp (object): subparsers object to add the parser to
+      settings (function): function returning the configuration
+        settings (used to set default values)
+    """
+    default_permissions = settings().general.permissions
+    default_group = settings().general.group
     update_cmd = sp.add_parser("update",
                               help="Update an analysis directory for a "
                               "Promethion project with new runs")
@@ -643,7 +701,14 @@ def bcf_nanopore_main():
                             (f"'{default_group}'" if default_group
                              else "don't set group",))
 
-    # Report command
+
+def _add_report_parser(sp):
+    """
+    Internal: add parser for the 'report' command
+
+    Arguments:
+      sp (object): subparsers object to add the parser to
+    """
     report_cmd = sp.add_parser("report",
                                help="report metadata from a PromethION "
                                "analysis directory")
@@ -688,7 +753,14 @@ def bcf_nanopore_main():
                             type=int,
                             help="only report N most recent runs")
 
-    # Metadata command
+
+def _add_metadata_parser(sp):
+    """
+    Internal: add parser for the 'metadata' command
+
+    Arguments:
+      sp (object): subparsers object to add the parser to
+    """
     metadata_cmd = sp.add_parser("metadata",
                                  help="report/update metadata for a PromethION "
                                  "analysis directory")
@@ -705,8 +777,19 @@ def bcf_nanopore_main():
                               help="update legacy metadata items and add missing "
                               "values")
 
-    # Fetch command
-    default_runner = settings.runners.rsync
+
+def _add_fetch_parser(sp, settings):
+    """
+    Internal: add parser for the 'fetch' command
+
+    Arguments:
+      sp (object): subparsers object to add the parser to
+      settings (function): function returning the configuration
+        settings (used to set default values)
+    """
+    default_permissions = settings().general.permissions
+    default_group = settings().general.group
+    default_runner = settings().runners.rsync
     fetch_cmd = sp.add_parser("fetch",
                               help="fetch BAM files from PromethION project "
                               "directory")
@@ -742,6 +825,67 @@ def bcf_nanopore_main():
                            default=default_runner,
                            help=f"job runner to use (default: "
                            f"'{default_runner}')")
+    fetch_cmd.add_argument('-v', '--verbose', action="store_true",
+                           help="report the full rsync command line "
+                           "used for the transfer")
+
+
+# Functions to add the parsers for each command, and whether
+# they need the configuration settings (to set default values)
+_COMMAND_PARSERS = {
+    "config": (_add_config_parser, False),
+    "info": (_add_info_parser, False),
+    "extract_metadata": (_add_extract_metadata_parser, False),
+    "setup": (_add_setup_parser, True),
+    "update": (_add_update_parser, True),
+    "report": (_add_report_parser, False),
+    "metadata": (_add_metadata_parser, False),
+    "fetch": (_add_fetch_parser, True),
+}
+
+
+def bcf_nanopore_main():
+
+    # Restore the default SIGPIPE handling so that piping output
+    # into e.g. 'head' terminates quietly (not available on all
+    # platforms)
+    if hasattr(signal, "SIGPIPE"):
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+
+    # Report the version and stop without building the parsers
+    # (NB output matches argparse's 'version' action)
+    if sys.argv[1:2] == ["--version"]:
+        print(f"{os.path.basename(sys.argv[0])} {get_version()}")
+        return
+
+    # Configuration settings (only loaded when first needed
+    # to set the defaults for command options)
+    @lru_cache(maxsize=None)
+    def settings():
+        return get_settings()
+
+    # Main parser
+    p = ArgumentParser()
+    sp = p.add_subparsers(dest='command')
+
+    # Version
+    p.add_argument('--version', action='version',
+                   version=("%%(prog)s %s" % get_version()))
+
+    # Only add the parser for the requested command, or for
+    # all commands if one can't be identified (e.g. for the
+    # top-level help)
+    command = _sniff_command(sys.argv[1:])
+    if command in _COMMAND_PARSERS:
+        commands = (command,)
+    else:
+        commands = tuple(_COMMAND_PARSERS)
+    for cmd in commands:
+        add_parser, uses_settings = _COMMAND_PARSERS[cmd]
+        if uses_settings:
+            add_parser(sp, settings)
+        else:
+            add_parser(sp)
 
     # Process command line
     args = p.parse_args()
@@ -750,7 +894,7 @@ def bcf_nanopore_main():
     if args.command == "config":
         config()
     if args.command == "info":
-        info(args.project_dir)
+        return info(args.project_dir)
     elif args.command == "setup":
         setup(args.project_dir, user=args.user, PI=args.pi,
               application=args.application, organism=args.organism,
@@ -774,6 +918,7 @@ def bcf_nanopore_main():
                most_recent=args.most_recent)
     elif args.command == "fetch":
         fetch(args.project_dir, args.dest,
-              file_types=[x for x in str(args.file_types).split(",")],
+              file_types=str(args.file_types).split(","),
               dry_run=args.dry_run, runner=args.runner,
-              permissions=args.permissions, group=args.group)
+              permissions=args.permissions, group=args.group,
+              verbose=args.verbose)
@@ -7,7 +7,9 @@
 """
 Utilities for creating mock data for testing
 """
+import os
 import json
+import logging
 from pathlib import Path
 from textwrap import dedent
 
@@ -15,6 +17,10 @@ from .analysis import ProjectInfo
 from .analysis import SamplesInfo
 from .analysis import FlowcellBasecallsInfo
 
+# Module specific logger
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 # Example JSON data from HTML files
 
 # MinKNOW v24
@@ -106,6 +112,20 @@ JSON_DATA_25 = {
     ]
 }
 
+# Barcode subdirectory names
+BARCODE_NAMES = tuple([f"barcode{n:02d}" for n in range(1, 97)])
+
+# Serialised contents for mock HTML reports, keyed by MinKNOW
+# version (the "__DATA_LOCATION__" placeholder is substituted
+# when each report is written)
+HTML_REPORT_TEMPLATES = {
+    version: dedent(f"""
+    const reportDataJson = {json.dumps(json_data)};
+    """)
+    for version, json_data in (("24", HTML_JSON_DATA_24),
+                               ("25", HTML_JSON_DATA_25))
+}
+
 
 class MockPromethionDataDir:
     """
@@ -169,9 +189,9 @@ class MockPromethionDataDir:
               directory structure under
         """
         # Make top level directory
-        mock_dir = Path(top_dir).absolute().joinpath(self.name)
-        mock_dir.mkdir()
-        print(f"...made {mock_dir}")
+        mock_dir = os.path.join(os.path.abspath(top_dir), self.name)
+        os.mkdir(mock_dir)
+        logger.debug("...made %s", mock_dir)
         return self.update(top_dir)
 
     def update(self, top_dir):
@@ -183,19 +203,19 @@ class MockPromethionDataDir:
             directory structure under
         """
         # Check top level directory
-        mock_dir = Path(top_dir).absolute().joinpath(self.name)
-        if not mock_dir.exists():
+        mock_dir = os.path.join(os.path.abspath(top_dir), self.name)
+        if not os.path.exists(mock_dir):
             raise OSError(f"Directory {mock_dir} does not exist")
-        print(f"...updating {mock_dir}")
+        logger.debug("...updating %s", mock_dir)
         # Add flow cells
         for fc in self._flow_cells:
-            if not fc.path(mock_dir).exists():
+            if not os.path.exists(fc.path(mock_dir)):
                 fc.create(mock_dir)
         # Add basecall dirs
         for bc in self._basecalls_dirs:
-            if not bc.path(mock_dir).exists():
+            if not os.path.exists(bc.path(mock_dir)):
                 bc.create(mock_dir)
-        return str(mock_dir)
+        return mock_dir
 
 class MockFlowcellDir:
     """
@@ -215,34 +235,33 @@ class MockFlowcellDir:
         Return path to mock flow cell directory
 
         Args:
-            top_dir (Path): directory to create
+            top_dir (str): directory to create
               mock flow cell directory under
 
         Returns:
-            Path: path to the mock flow cell directory
+            String: path to the mock flow cell directory
         """
         if self.relpath:
-            return Path(top_dir).joinpath(self.relpath,
-                                          self.name)
-        return Path(top_dir).joinpath(self.name)
+            return os.path.join(top_dir, self.relpath, self.name)
+        return os.path.join(top_dir, self.name)
 
     def create(self, top_dir):
         """
         Create the mock flow cell directory
 
         Arguments:
-            top_dir (Path): directory to create the
+            top_dir (str): directory to create the
               mock flow cell directory under
         """
         fc_path = self.path(top_dir)
-        fc_path.mkdir(parents=True)
-        print(f"...made {fc_path}")
+        os.makedirs(fc_path)
+        logger.debug("...made %s", fc_path)
         # Make subdirs
         self.create_pod5_dirs(fc_path)
         for name in ("bam", "fastq"):
             self.create_data_dirs(name,fc_path)
         self.create_reports(fc_path)
-        return str(fc_path)
+        return fc_path
 
     def create_data_dirs(self, name, top_dir):
         """
@@ -250,13 +269,13 @@ class MockFlowcellDir:
 
         Arguments:
             name (str): name of the data type ("bam", "fastq")
-            top_dir (Path): directory to create mock
+            top_dir (str): directory to create mock
               data directories under
         """
         for ext in ("pass", "fail"):
-            data_dir = top_dir.joinpath(f"{name}_{ext}")
-            data_dir.mkdir()
-            print(f"...made {data_dir}")
+            data_dir = os.path.join(top_dir, f"{name}_{ext}")
+            os.mkdir(data_dir)
+            logger.debug("...made %s", data_dir)
             create_barcode_dirs(data_dir)
 
     def create_pod5_dirs(self, top_dir):
@@ -264,13 +283,13 @@ class MockFlowcellDir:
         Create POD5 directories
 
         Argument:
-          top_dir (Path): directory to create mock
+          top_dir (str): directory to create mock
             POD5 directories under
         """
         for name in ("pod5", "pod5_skip"):
-            pod5_path = top_dir.joinpath(name)
-            pod5_path.mkdir()
-            print(f"...made {pod5_path}")
+            pod5_path = os.path.join(top_dir, name)
+            os.mkdir(pod5_path)
+            logger.debug("...made %s", pod5_path)
 
     def create_reports(self, top_dir, reports=("html", "json"),
                        minknow_version="25"):
@@ -278,7 +297,7 @@ class MockFlowcellDir:
         Create report files
 
         Arguments:
-          top_dir (Path): directory to create the
+          top_dir (str): directory to create the
             mock reports under
           reports (list): list of the report types to create
             (default: "html" and "json")
@@ -294,19 +313,19 @@ class MockFlowcellDir:
         Create report file
 
         Arguments:
-          top_dir (Path): directory to create the
+          top_dir (str): directory to create the
             mock report under
           report_type (str): either "html" or "json"
           minknow_version (str): either "24" or "25"
         """
-        report_file = top_dir.joinpath(f"report_{self.name}.{report_type}")
+        report_file = os.path.join(top_dir, f"report_{self.name}.{report_type}")
         if report_type == "html":
-            create_html_report(str(report_file), minknow_version=minknow_version)
+            create_html_report(report_file, minknow_version=minknow_version)
         elif report_type == "json":
-            create_json_report(str(report_file), minknow_version=minknow_version)
+            create_json_report(report_file, minknow_version=minknow_version)
         else:
             raise Exception(f"{report_type}: unsupported report type")
-        print(f"...made {report_file}")
+        logger.debug("...made %s", report_file)
 
 
 class MockBasecallsDir:
@@ -326,41 +345,41 @@ class MockBasecallsDir:
         Return path to mock basecalls directory
 
         Args:
-            top_dir (Path): directory to create
+            top_dir (str): directory to create
               mock basecalls directory under
 
         Returns:
-            Path: path to the mock basecalls directory
+            String: path to the mock basecalls directory
         """
-        return Path(top_dir).joinpath(self.relpath)
+        return os.path.join(top_dir, self.relpath)
 
     def create(self, top_dir):
         """
         Create the mock base calls directory
 
         Arguments:
-            top_dir (Path): directory to create the
+            top_dir (str): directory to create the
               mock flow cell directory under
         """
         bc_path = self.path(top_dir)
-        bc_path.mkdir(parents=True)
-        print(f"...made {bc_path}")
+        os.makedirs(bc_path)
+        logger.debug("...made %s", bc_path)
         # Make subdirs
         self.create_pass_dir(bc_path)
         self.create_reports(bc_path)
-        return str(bc_path)
+        return bc_path
 
     def create_pass_dir(self, top_dir):
         """
         Create the "pass" subdirectory
 
         Arguments:
-            top_dir (Path): directory to create the
+            top_dir (str): directory to create the
               mock "pass" directory under
         """
-        pass_dir = top_dir.joinpath("pass")
-        pass_dir.mkdir()
-        print(f"...made {pass_dir}")
+        pass_dir = os.path.join(top_dir, "pass")
+        os.mkdir(pass_dir)
+        logger.debug("...made %s", pass_dir)
         create_barcode_dirs(pass_dir)
 
     def create_reports(self, top_dir, reports=("html", "json"),
@@ -369,7 +388,7 @@ class MockBasecallsDir:
         Create report files
 
         Arguments:
-          top_dir (Path): directory to create the
+          top_dir (str): directory to create the
             mock reports under
           reports (list): list of the report types to create
             (default: "html" and "json")
@@ -385,24 +404,24 @@ class MockBasecallsDir:
         Create report file
 
         Arguments:
-          top_dir (Path): directory to create the
+          top_dir (str): directory to create the
             mock report under
           report_type (str): either "html" or "json"
           minknow_version (str): either "24" or "25"
         """
 
         if self.flow_cell_name:
-            report_file = top_dir.joinpath(
-                f"report_{self.flow_cell_name}.{report_type}")
+            report_file = os.path.join(
+                top_dir, f"report_{self.flow_cell_name}.{report_type}")
             if report_type == "html":
-                create_html_report(str(report_file),
+                create_html_report(report_file,
                                    minknow_version=minknow_version)
             elif report_type == "json":
-                create_json_report(str(report_file),
+                create_json_report(report_file,
                                    minknow_version=minknow_version)
             else:
                 raise Exception(f"{report_type}: unsupported report type")
-            print(f"...made {report_file}")
+            logger.debug("...made %s", report_file)
 
 
 class MockProjectAnalysisDir:
@@ -477,7 +496,7 @@ class MockProjectAnalysisDir:
         Create mock PromethION analysis project directory
 
         Arguments:
-          top_dir (Path): directory to create the
+          top_dir (str): directory to create the
             mock directory under
           data_dir (str): path to primary data directory
             (optional)
@@ -492,15 +511,15 @@ class MockProjectAnalysisDir:
             to add to the project metadata
         """
         # Make top level directory
-        top_dir = Path(top_dir).absolute().joinpath(self.name)
-        top_dir.mkdir()
-        print(f"...made {top_dir}")
+        top_dir = os.path.join(os.path.abspath(top_dir), self.name)
+        os.mkdir(top_dir)
+        logger.debug("...made %s", top_dir)
         # Add in subdirs
         for subdir in ("logs", "ScriptCode"):
-            top_dir.joinpath(subdir).mkdir()
+            os.mkdir(os.path.join(top_dir, subdir))
         # Add in placeholder files
         for file_name in ("README",):
-            top_dir.joinpath(file_name).touch()
+            open(os.path.join(top_dir, file_name), "wt").close()
         # Add in project info file
         project_info = ProjectInfo()
         metadata_values = {
@@ -516,13 +535,14 @@ class MockProjectAnalysisDir:
             if value:
                 project_info[k] = value
         if data_dir:
-            project_info['name'] = str(Path(data_dir).name)
+            project_info['name'] = os.path.basename(str(data_dir))
             project_info['data_dir'] = str(data_dir)
         project_info['platform'] = "promethion"
-        project_info.save(filen=str(top_dir.joinpath("project.info")))
+        project_info_file = os.path.join(top_dir, "project.info")
+        project_info.save(filen=project_info_file)
         if extra_project_metadata:
             # Append extra items to the metadata file
-            with open(str(top_dir.joinpath("project.info")), "at") as fp:
+            with open(project_info_file, "at") as fp:
                 for key in extra_project_metadata:
                     value = extra_project_metadata[key]
                     if value is None:
@@ -530,15 +550,16 @@ class MockProjectAnalysisDir:
                     fp.write(f"{key}\t{value}\n")
         # Add in run subdirectories
         for ix, run in enumerate(self.runs.keys()):
-            run_dir = top_dir.joinpath(f"{ix+1:03d}_{run}")
-            run_dir.mkdir()
-            print(f"...made run '{run}' ({run_dir})")
+            run_dir = os.path.join(top_dir, f"{ix+1:03d}_{run}")
+            os.mkdir(run_dir)
+            logger.debug("...made run '%s' (%s)", run, run_dir)
             # Add artefacts to run directory
             # Placeholder README file
-            with open(run_dir.joinpath("README"), "wt") as fp:
+            with open(os.path.join(run_dir, "README"), "wt") as fp:
                 fp.write("Placeholder README file\n")
             # flowcell_basecalls.tsv file
-            with open(run_dir.joinpath("flowcell_basecalls.tsv"), "wt") as fp:
+            with open(os.path.join(run_dir, "flowcell_basecalls.tsv"),
+                      "wt") as fp:
                 fp.write("#%s\n" % "\t".join(["Run", "SubDir", "FlowCellID",
                                               "Reports", "Kit", "Modifications",
                                               "TrimBarcodes", "MinknowVersion",
@@ -557,23 +578,21 @@ class MockProjectAnalysisDir:
                                                      "dna_r10.4.1_e8.2_400bps_hac@v4.3.0",
                                                      "pod5,bam,fastq"]))
             # Samples file
-            with open(run_dir.joinpath("samples.tsv"), "wt") as fp:
+            with open(os.path.join(run_dir, "samples.tsv"), "wt") as fp:
                 fp.write("#Sample\tBarcode\tFlowcell\n")
                 if self.runs[run]:
                     for sample in self.runs[run]:
                         barcode, flowcell = self.runs[run][sample]
                         fp.write(f"{sample}\t{barcode}\t{flowcell}\n")
-            with open(run_dir.joinpath("samples.tsv"), "rt") as fp:
-                print(fp.read())
             # Metadata file
-            with open(run_dir.joinpath("run.info"), "wt") as fp:
+            with open(os.path.join(run_dir, "run.info"), "wt") as fp:
                 fp.write(f"Run name\t{run}\n")
                 if self.run_metadata[run]:
                     for item, value in self.run_metadata[run].items():
                         if value is None:
                             value = "."
                         fp.write(f"{item}\t{value}\n")
-        return str(top_dir)
+        return top_dir
 
 def create_barcode_dirs(top_dir, number_of_barcodes=24):
     """
@@ -582,14 +601,19 @@ def create_barcode_dirs(top_dir, number_of_barcodes=24):
     NB directories are not populated
 
     Arguments:
-      top_dir (Path): directory to create mock
+      top_dir (str): directory to create mock
         barcode directories under
       number_of_barcodes (int): number of barcode
         directories to create
     """
-    for n in range(0,number_of_barcodes):
-        barcode_dir = top_dir.joinpath(f"barcode{n+1:02d}")
-        barcode_dir.mkdir()
+    top_dir = str(top_dir)
+    if number_of_barcodes <= len(BARCODE_NAMES):
+        barcode_names = BARCODE_NAMES[:number_of_barcodes]
+    else:
+        barcode_names = [f"barcode{n+1:02d}"
+                         for n in range(number_of_barcodes)]
+    for barcode_name in barcode_names:
+        os.mkdir(os.path.join(top_dir, barcode_name))
         # Don't populate with files for now
 
 def create_html_report(file_name, minknow_version="25"):
@@ -603,23 +627,16 @@ def create_html_report(file_name, minknow_version="25"):
             mimick (either "24" or "25"; default is
             "25")
         """
-        # Fetch appropriate example JSON data
-        if minknow_version == "25":
-            json_data = HTML_JSON_DATA_25
-        elif minknow_version == "24":
-            json_data = HTML_JSON_DATA_24
-        else:
+        # Fetch appropriate serialised example JSON data
+        try:
+            template = HTML_REPORT_TEMPLATES[minknow_version]
+        except KeyError:
             raise Exception(f"Unable to create report for MinKNOW "
                             f"version '{minknow_version}'")
-        # Update the "Data location" value
-        for s in json_data["data_output_settings"]:
-            if s["title"] == "Data location":
-                s["value"] == f"\"{str(Path(file_name).parent)}\""
-        # Write the mock HTML file
+        # Set the "Data location" value and write the mock HTML file
+        data_location = json.dumps(str(Path(file_name).parent))
         Path(file_name).write_text(
-            dedent(f"""
-            const reportDataJson = {json.dumps(json_data)};
-            """))
+            template.replace('"__DATA_LOCATION__"', data_location))
 
 def create_json_report(file_name, minknow_version="25"):
         """
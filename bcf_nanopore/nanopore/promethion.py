@@ -30,15 +30,23 @@ Provides the following functions:
 import os
 import re
 import json
+import mmap
 import shutil
 import logging
-from pathlib import Path
+from functools import lru_cache
+from operator import attrgetter
 
 # Module specific logger
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
-RE_FLOW_CELL_NAME = re.compile("^([0-9]+)_([0-9]+)_([0-9][A-Z])_(P[A-Z][A-Z][0-9]+)_([a-z0-9]+)$")
+# NB names should be matched using 'fullmatch'
+RE_FLOW_CELL_NAME = re.compile(
+    r"([0-9]+)_([0-9]+)_([0-9][A-Z])_(P[A-Z]{2}[0-9]+)_([a-z0-9]+)",
+    re.ASCII)
+
+# Translation table for converting report titles to keys
+_TITLE_TO_KEY = str.maketrans({' ': '_', '-': '_', '.': None})
 
 
 class ProjectDir:
@@ -53,17 +61,19 @@ class ProjectDir:
         self.path = os.path.abspath(path)
         self.name = os.path.basename(self.path)
         # Scan the top-level directory for runs
-        self.runs = []
-        for d in Path(self.path).iterdir():
-            if d.is_dir():
-                print("...analysing subdirectory '%s'" % d)
-                run = RunDir(str(d))
-                if run.flow_cells or run.basecalls_dirs:
-                    print("...adding run '%s'" % run.name)
-                    self.runs.append(run)
+        # NB modification times are taken from the directory
+        # entries as they are scanned, for sorting below
+        runs = []
+        with os.scandir(self.path) as entries:
+            for d in entries:
+                if d.is_dir():
+                    logger.info("analysing subdirectory '%s'", d.path)
+                    run = RunDir(d.path)
+                    if run.flow_cells or run.basecalls_dirs:
+                        logger.info("adding run '%s'", run.name)
+                        runs.append((d.stat().st_mtime, run))
         # Sort runs by modification time (oldest first)
-        self.runs = sorted(self.runs,
-                           key=lambda x: os.path.getmtime(Path(self.path).joinpath(x.name)))
+        self.runs = [run for _, run in sorted(runs, key=lambda x: x[0])]
 
     @property
     def flow_cells(self):
@@ -95,8 +105,6 @@ class RunDir:
     """
 
     def __init__(self, path):
-        self.path = os.path.abspath(path)
-        self.name = os.path.basename(self.path)
         self.path = os.path.abspath(path)
         self.name = os.path.basename(self.path)
         # Walk the directory structure looking for "pod5", "*_pass"
@@ -104,31 +112,55 @@ class RunDir:
         # Use these to identify flow cell and basecalls directories
         self.flow_cells = []
         self.basecalls_dirs = []
-        print("...scanning %s" % self.path)
+        logger.info("scanning %s", self.path)
         flow_cell_dirs = set()
         basecalls_dirs = set()
-        for root, dirs, files in os.walk(path):
+        # NB the data subdirectories of flow cell and basecalls
+        # directories (which can hold very large numbers of files)
+        # are not descended into
+        dirs_to_scan = [path]
+        while dirs_to_scan:
+            root = dirs_to_scan.pop()
+            try:
+                with os.scandir(root) as it:
+                    dirs = [e for e in it if e.is_dir()]
+            except OSError:
+                # Ignore unreadable directories (as 'os.walk' does)
+                continue
+            is_data_dir = False
             for d in dirs:
-                if d == "pass":
+                if d.name == "pass":
                     # Base calls directory
                     basecalls_dirs.add(root)
+                    is_data_dir = True
                     break
-                elif d == "pod5" or d.endswith("_pass"):
+                elif d.name == "pod5" or d.name.endswith("_pass"):
                     # Flow cell directory
                     flow_cell_dirs.add(root)
+                    is_data_dir = True
                     break
-        print("...located %d flow cell directories" % len(flow_cell_dirs))
+            for d in dirs:
+                if d.is_symlink():
+                    continue
+                if is_data_dir and (d.name in ("pass", "fail") or
+                                    d.name.startswith("pod5") or
+                                    d.name.endswith(("_pass", "_fail"))):
+                    continue
+                dirs_to_scan.append(d.path)
+        logger.info("located %d flow cell directories",
+                    len(flow_cell_dirs))
         for d in flow_cell_dirs:
-            print("...adding flow cell '%s'" % d)
+            logger.info("adding flow cell '%s'", d)
             fc = FlowCell(d, run=self.name)
             self.flow_cells.append(fc)
-        self.flow_cells = sorted(self.flow_cells, key=lambda x: x.name)
-        print("...located %d base calls directories" % len(basecalls_dirs))
+        self.flow_cells.sort(key=attrgetter("name"))
+        logger.info("located %d base calls directories",
+                    len(basecalls_dirs))
         for d in basecalls_dirs:
-            print("...adding base call dir '%s'" % d)
+            logger.info("adding base call dir '%s'", d)
             bc = BasecallsDir(d, run=self.name)
             self.basecalls_dirs.append(bc)
-        self.basecalls_dirs = sorted(self.basecalls_dirs, key=lambda x: x.name)
+        self.basecalls_dirs.sort(key=attrgetter("name"))
 
 class FlowCell:
     """
@@ -143,41 +175,52 @@ class FlowCell:
         self.path = os.path.abspath(path)
         self.name = os.path.basename(self.path)
         self.run = run
-        # Associated metadata
-        self.metadata = BasecallsMetadata()
+        # Associated metadata (loaded from the reports on demand)
+        self._metadata = None
         # Name and ID for flow cell
-        if not is_flow_cell_name(self.name):
+        m = _match_flow_cell_name(self.name)
+        if not m:
             raise Exception("'%s': not a flow cell name?" % self.name)
-        self.id = get_flow_cell_id(self.name)
-        self.datestamp = get_flow_cell_datestamp(self.name)
+        self.id = m.group(4)
+        self.datestamp = m.group(1)
+        # Scan the flow cell directory once, and take the
+        # subdirectories and reports from the listing
+        with os.scandir(self.path) as it:
+            entries = sorted([(e.name, e.is_dir()) for e in it])
+        dir_names = set([name for name, is_dir in entries if is_dir])
         # POD5 directory
+        self.pod5 = None
         for d in ("pod5", "pod5_pass"):
-            self.pod5 = os.path.join(self.path, d)
-            if os.path.exists(self.pod5):
+            if d in dir_names:
+                self.pod5 = os.path.join(self.path, d)
                 break
-            else:
-                self.pod5 = None
         # BAMs directory
-        self.bam_pass = os.path.join(self.path, "bam_pass")
-        if not os.path.exists(self.bam_pass):
-            self.bam_pass = None
+        self.bam_pass = None
+        if "bam_pass" in dir_names:
+            self.bam_pass = os.path.join(self.path, "bam_pass")
         # FASTQs directory
-        self.fastq_pass = os.path.join(self.path, "fastq_pass")
-        if not os.path.exists(self.fastq_pass):
-            self.fastq_pass = None
+        self.fastq_pass = None
+        if "fastq_pass" in dir_names:
+            self.fastq_pass = os.path.join(self.path, "fastq_pass")
         # Reports
         self.reports = []
+        self._metadata_reports = []
+        self.html_report = None
+        self.json_report = None
         self.sample_sheet = None
-        for f in os.listdir(self.path):
+        for f, _ in entries:
             if f.startswith("report_"):
                 self.reports.append(f)
-                if f.endswith(".html") or f.endswith(".json"):
-                    try:
-                        self.metadata.load_from_report(
-                            os.path.join(self.path, f))
-                    except Exception as ex:
-                        print(f"{f}: failed to load metadata from file "
-                              f"(ignored): {ex}")
+                ext = f.rpartition(".")[2]
+                if ext == "html":
+                    if not self.html_report:
+                        self.html_report = os.path.join(self.path, f)
+                elif ext == "json":
+                    if not self.json_report:
+                        self.json_report = os.path.join(self.path, f)
+                else:
+                    continue
+                self._metadata_reports.append(f)
             elif f.startswith("sample_sheet_"):
                 self.sample_sheet = f
 
@@ -192,6 +235,19 @@ class FlowCell:
             file_types.append("fastq")
         return file_types
 
+    @property
+    def metadata(self):
+        """
+        Return BasecallsMetadata loaded from the reports
+
+        The metadata is loaded from the HTML and JSON
+        reports the first time it is accessed.
+        """
+        if self._metadata is None:
+            self._metadata = _load_metadata(self.path,
+                                            self._metadata_reports)
+        return self._metadata
+
     @property
     def report_types(self):
         report_types = []
@@ -201,20 +257,6 @@ class FlowCell:
             report_types.append("json")
         return report_types
 
-    @property
-    def html_report(self):
-        for f in self.reports:
-            if f.endswith(".html"):
-                return os.path.join(self.path, f)
-        return None
-
-    @property
-    def json_report(self):
-        for f in self.reports:
-            if f.endswith(".json"):
-                return os.path.join(self.path, f)
-        return None
-
     def __repr__(self):
         return self.name
 
@@ -231,29 +273,39 @@ class BasecallsDir:
 
     def __init__(self, path, run=None):
         self.path = os.path.abspath(path)
-        self.name = os.path.basename(path)
-        self.parent = os.path.basename(os.path.dirname(self.path))
+        parent_dir, self.name = os.path.split(self.path)
+        self.parent = os.path.basename(parent_dir)
         # Assign parent run
         self.run = run
-        # Associated metadata
-        self.metadata = BasecallsMetadata()
+        # Associated metadata (loaded from the reports on demand)
+        self._metadata = None
+        # Scan the basecalls directory once, and take the
+        # subdirectories and reports from the listing
+        with os.scandir(self.path) as it:
+            entries = sorted([(e.name, e.is_dir()) for e in it])
         # BAMs and FASTQs directory
-        self.pass_dir = os.path.join(self.path, "pass")
-        if not os.path.exists(self.pass_dir):
-            self.pass_dir = None
+        self.pass_dir = None
+        if ("pass", True) in entries:
+            self.pass_dir = os.path.join(self.path, "pass")
         # Reports
         self.reports = []
+        self._metadata_reports = []
+        self.html_report = None
+        self.json_report = None
         self.sample_sheet = None
-        for f in os.listdir(self.path):
+        for f, _ in entries:
             if f.startswith("report_"):
                 self.reports.append(f)
-                if f.endswith(".html") or f.endswith(".json"):
-                    try:
-                        self.metadata.load_from_report(
-                            os.path.join(self.path, f))
-                    except Exception as ex:
-                        print(f"{f}: failed to load metadata from file "
-                              f"(ignored): {ex}")
+                ext = f.rpartition(".")[2]
+                if ext == "html":
+                    if not self.html_report:
+                        self.html_report = os.path.join(self.path, f)
+                elif ext == "json":
+                    if not self.json_report:
+                        self.json_report = os.path.join(self.path, f)
+                else:
+                    continue
+                self._metadata_reports.append(f)
             elif f.startswith("sample_sheet_"):
                 self.sample_sheet = f
 
@@ -264,6 +316,19 @@ class BasecallsDir:
         else:
             return []
 
+    @property
+    def metadata(self):
+        """
+        Return BasecallsMetadata loaded from the reports
+
+        The metadata is loaded from the HTML and JSON
+        reports the first time it is accessed.
+        """
+        if self._metadata is None:
+            self._metadata = _load_metadata(self.path,
+                                            self._metadata_reports)
+        return self._metadata
+
     @property
     def report_types(self):
         report_types = []
@@ -273,20 +338,6 @@ class BasecallsDir:
             report_types.append("json")
         return report_types
 
-    @property
-    def html_report(self):
-        for f in self.reports:
-            if f.endswith(".html"):
-                return os.path.join(self.path, f)
-        return None
-
-    @property
-    def json_report(self):
-        for f in self.reports:
-            if f.endswith(".json"):
-                return os.path.join(self.path, f)
-        return None
-
     def __repr__(self):
         return "%s/%s" % (self.parent, self.name)
 
@@ -309,18 +360,61 @@ class HtmlReport:
         Attempts to locate the JSON data embedded in an HTML
         report file and return as a JSON object.
         """
-        json_data = None
-        with open(self.path, "rt") as fp:
-            for line in fp:
-                if line.strip().startswith("const reportDataJson = {"):
-                    json_data = line.strip()[len("const reportDataJson = "):-1]
-                    break
-                elif line.strip().startswith("const reportData={"):
-                    json_data = line.strip()[len("const reportData="):]
-                    break
-        if json_data is None:
+        # NB the report is scanned as bytes (via 'mmap') so that
+        # the file (which can be large) isn't decoded and split
+        # into lines
+        matches = []
+        with open(self.path, "rb") as fp:
+            try:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file
+                data = b""
+            try:
+                for marker, trim_end in ((b"const reportDataJson = ", 1),
+                                         (b"const reportData=", 0)):
+                    match = self._find_line(data, marker + b"{")
+                    if match:
+                        pos, line = match
+                        matches.append(
+                            (pos, line[len(marker):len(line) - trim_end]))
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+        if not matches:
             raise Exception("%s: unable to extract JSON data" % self.path)
-        return json.loads(json_data)
+        # Use the data from the first matching line in the file
+        return json.loads(min(matches)[1])
+
+    @staticmethod
+    def _find_line(data, prefix):
+        """
+        Internal: locate first line starting with a prefix
+
+        Leading and trailing whitespace on the line is
+        ignored.
+
+        Arguments:
+          data (bytes): data to search (e.g. memory-mapped
+            file contents)
+          prefix (bytes): prefix to look for
+
+        Returns:
+          Tuple: pair of (position, line) where 'line' is
+            the matching line as bytes with whitespace
+            stripped, or None if no line starts with the
+            prefix.
+        """
+        i = data.find(prefix)
+        while i != -1:
+            start = data.rfind(b"\n", 0, i) + 1
+            if not data[start:i].strip():
+                end = data.find(b"\n", i)
+                if end == -1:
+                    end = len(data)
+                return (i, data[i:end].strip())
+            i = data.find(prefix, i + 1)
+        return None
 
     def __repr__(self):
         return self.path
@@ -364,7 +458,7 @@ class BasecallsMetadata:
     """
 
     def __init__(self):
-        self.html_json_data = None
+        self.html_report = None
         self.json_data = None
         self.flow_cell_id = None
         self.flow_cell_type = None
@@ -396,12 +490,15 @@ class BasecallsMetadata:
         Arguments:
           html_file (str): path to the HTML report
         """
-        self.html_json_data = HtmlReport(html_file).extract_json()
+        # NB the extracted JSON data isn't kept (as it can be
+        # large), only the path to the report
+        html_json_data = HtmlReport(html_file).extract_json()
+        self.html_report = html_file
         data = {}
         for k in ('run_settings',
                   'run_setup',
                   'software_versions'):
-            data[k] = self._extract_section(self.html_json_data, k)
+            data[k] = self._extract_section(html_json_data, k)
         # Set values
         setup = data['run_setup']
         ##print(setup)
@@ -432,11 +529,14 @@ class BasecallsMetadata:
     def html_json(self):
         """
         Return JSON data extracted from the HTML report
+
+        The data is re-read from the report file each time
+        this method is invoked.
         """
-        if self.html_json_data is None:
+        if self.html_report is None:
             return {}
-        return json.dumps(self.html_json_data, sort_keys=True,
-                          indent=4)
+        return json.dumps(HtmlReport(self.html_report).extract_json(),
+                          sort_keys=True, indent=4)
 
     def load_from_report_json(self, json_file):
         """
@@ -446,22 +546,20 @@ class BasecallsMetadata:
           json_file (str): path to the JSON report
         """
         self.json_data = JsonReport(json_file).extract_json()
-        try:
-            for acquisition in self.json_data["acquisitions"]:
-                # Basecalling model
-                if not self.basecalling_model:
-                    try:
-                        self.basecalling_model = acquisition["acquisition_run_info"]["config_summary"]["basecalling_model_version"]
-                    except KeyError:
-                        pass
-                # Basecalling config
-                if not self.basecalling_config:
-                    try:
-                        self.basecalling_config = acquisition["acquisition_run_info"]["config_summary"]["basecalling_config_filename"]
-                    except KeyError:
-                        pass
-        except KeyError:
-            pass
+        for acquisition in self.json_data.get("acquisitions", []):
+            config_summary = acquisition.get("acquisition_run_info",
+                                             {}).get("config_summary", {})
+            # Basecalling model
+            if not self.basecalling_model:
+                self.basecalling_model = config_summary.get(
+                    "basecalling_model_version")
+            # Basecalling config
+            if not self.basecalling_config:
+                self.basecalling_config = config_summary.get(
+                    "basecalling_config_filename")
+            # Stop once both items have been found
+            if self.basecalling_model and self.basecalling_config:
+                break
         return self
 
     def json(self):
@@ -482,18 +580,16 @@ class BasecallsMetadata:
         key with the corresponding 'value'.
 
         Key names are generated from 'title' strings by
-        converting to lower case and replacing ' ', '-'
-        and '.' characters to underscores.
+        converting to lower case, replacing ' ' and '-'
+        characters with underscores, and removing '.'
+        characters.
 
         Arguments:
           json_data (dict): JSON data
           name (str): name of the section to extract
         """
         return {
-            s['title'].lower()
-            .replace(' ', '_')
-            .replace('-', '_')
-            .replace('.', ''): s['value']
+            _title_to_key(s['title']): s['value']
             for s in json_data[name]
         }
 
@@ -503,10 +599,72 @@ class BasecallsMetadata:
         try:
             return data[name]
         except KeyError:
-            logger.warning(f"'{name}': metadata item not found")
+            logger.warning("'%s': metadata item not found", name)
             return None
 
 
+@lru_cache(maxsize=1024)
+def _title_to_key(title):
+    """
+    Internal: convert a report title to a key name
+
+    Results are cached, as the same titles appear in
+    the reports for every flow cell.
+
+    Arguments:
+      title (str): title from a report section
+
+    Returns:
+      String: key name.
+    """
+    return title.lower().translate(_TITLE_TO_KEY)
+
+
+def _load_metadata(path, reports):
+    """
+    Internal: load metadata from a set of report files
+
+    Failures to load metadata from individual reports
+    are logged as warnings and otherwise ignored.
+
+    Arguments:
+      path (str): path to the directory holding the
+        reports
+      reports (list): list of HTML and JSON report file
+        names to load metadata from
+
+    Returns:
+      BasecallsMetadata: metadata loaded from the reports.
+    """
+    metadata = BasecallsMetadata()
+    for f in reports:
+        try:
+            metadata.load_from_report(os.path.join(path, f))
+        except Exception as ex:
+            logger.warning("%s: failed to load metadata from "
+                           "file (ignored): %s", f, ex)
+    return metadata
+
+
+def _match_flow_cell_name(name):
+    """
+    Internal: match a name against the flow cell name pattern
+
+    Arguments:
+      name (str): putative flow cell name
+
+    Returns:
+      Match: match object, or None if the name doesn't
+        look like a flow cell name.
+    """
+    # Quick check to reject most other names before using
+    # the regular expression (flow cell names start with a
+    # digit and have exactly 4 underscores)
+    if not name[:1].isdigit() or name.count("_") != 4:
+        return None
+    return RE_FLOW_CELL_NAME.fullmatch(name)
+
+
 def is_flow_cell_name(name):
     """
     Check if a name looks like a flow cell
@@ -518,7 +676,7 @@ def is_flow_cell_name(name):
       Boolean: True if name is a flow cell name,
         False otherwise.
     """
-    return bool(RE_FLOW_CELL_NAME.match(name))
+    return bool(_match_flow_cell_name(name))
 
 
 def get_flow_cell_id(name):
@@ -532,7 +690,7 @@ def get_flow_cell_id(name):
       String: flow cell ID, or "" if ID cannot be extracted.
     """
     try:
-        return RE_FLOW_CELL_NAME.match(name).group(4)
+        return _match_flow_cell_name(name).group(4)
     except AttributeError:
         return ""
 
@@ -548,7 +706,7 @@ def get_flow_cell_datestamp(name):
       String: flow cell date stamp.
     """
     try:
-        return RE_FLOW_CELL_NAME.match(name).group(1)
+        return _match_flow_cell_name(name).group(1)
     except AttributeError:
         return ""
 
@@ -564,6 +722,6 @@ def barcode_dirs(d):
       List: list of subdirectory names under the supplied
         directory with names 'barcode...'.
     """
-    return sorted([b for b in filter(lambda x: x.startswith("barcode")
-                   and os.path.isdir(os.path.join(d, x)),
-                                     os.listdir(d))])
+    with os.scandir(d) as entries:
+        return sorted([e.name for e in entries
+                       if e.name.startswith("barcode") and e.is_dir()])
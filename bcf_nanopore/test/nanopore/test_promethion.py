@@ -22,14 +22,37 @@ from bcf_nanopore.nanopore.promethion import JsonReport
 from bcf_nanopore.nanopore.promethion import BasecallsMetadata
 
 
-class TestProjectDir(unittest.TestCase):
+class SharedTempDirTestCase(unittest.TestCase):
+    """
+    Base class for tests needing a temporary directory
+
+    Creates a base directory (as '_base_dir') which is shared
+    by all the tests in the class, and removed once they have
+    finished.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls._base_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._base_dir, ignore_errors=True)
+
+
+class TempDirTestCase(SharedTempDirTestCase):
+    """
+    Base class for tests needing temporary working directories
+
+    In addition to the shared base directory, creates a fresh
+    working directory under it for each test (as 'self.wd').
+    """
 
     def setUp(self):
-        self.wd = tempfile.mkdtemp()
+        self.wd = tempfile.mkdtemp(dir=self._base_dir)
+
 
-    def tearDown(self):
-        if Path(self.wd).exists():
-            shutil.rmtree(self.wd)
+class TestProjectDir(TempDirTestCase):
 
     def test_project_dir_single_run(self):
         """
@@ -63,14 +86,7 @@ class TestProjectDir(unittest.TestCase):
         self.assertEqual(project.name, "PromethION_Project_001_PerGynt")
         self.assertEqual(len(project.flow_cells), 3)
 
-class TestRunDir(unittest.TestCase):
-
-    def setUp(self):
-        self.wd = tempfile.mkdtemp()
-
-    def tearDown(self):
-        if Path(self.wd).exists():
-            shutil.rmtree(self.wd)
+class TestRunDir(TempDirTestCase):
 
     def test_run_dir_with_flow_cells(self):
         """
@@ -102,14 +118,7 @@ class TestRunDir(unittest.TestCase):
         self.assertEqual(len(run_dir.basecalls_dirs), 1)
 
 
-class TestFlowCell(unittest.TestCase):
-
-    def setUp(self):
-        self.wd = tempfile.mkdtemp()
-
-    def tearDown(self):
-        if Path(self.wd).exists():
-            shutil.rmtree(self.wd)
+class TestFlowCell(TempDirTestCase):
 
     def test_flow_cell(self):
         """
@@ -185,14 +194,7 @@ class TestFlowCell(unittest.TestCase):
                          "dna_r10.4.1_e8.2_400bps_hac@v4.3.0")
         self.assertEqual(flow_cell.metadata.basecalling_config, None)
 
-class TestBasecallsDir(unittest.TestCase):
-
-    def setUp(self):
-        self.wd = tempfile.mkdtemp()
-
-    def tearDown(self):
-        if Path(self.wd).exists():
-            shutil.rmtree(self.wd)
+class TestBasecallsDir(TempDirTestCase):
 
     def test_basecalls_dir(self):
         """
@@ -265,50 +267,116 @@ class TestBasecallsDir(unittest.TestCase):
                          "dna_r10.4.1_e8.2_400bps_hac@v4.3.0")
         self.assertEqual(basecalls.metadata.basecalling_config, None)
 
-class TestHtmlReport(unittest.TestCase):
-
-    def setUp(self):
-        self.wd = tempfile.mkdtemp()
+class TestHtmlReport(SharedTempDirTestCase):
 
-    def tearDown(self):
-        if Path(self.wd).exists():
-            shutil.rmtree(self.wd)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Mock report shared by the tests
+        cls.html_report_file = str(Path(cls._base_dir).joinpath(
+            "report_BLAH.html"))
+        create_html_report(cls.html_report_file)
 
     def test_html_report(self):
         """
         HtmlReport: load from file
         """
-        html_report_file = Path(self.wd).joinpath("report_BLAH.html")
-        create_html_report(str(html_report_file))
-        html_report = HtmlReport(str(html_report_file))
+        html_report = HtmlReport(self.html_report_file)
         self.assertIsNotNone(html_report.extract_json())
 
-class TestJsonReport(unittest.TestCase):
+    def _make_report(self, name, contents):
+        # Internal: write an HTML report with the supplied
+        # contents (bytes) and return the path
+        report_file = str(Path(self._base_dir).joinpath(name))
+        with open(report_file, "wb") as fp:
+            fp.write(contents)
+        return report_file
 
-    def setUp(self):
-        self.wd = tempfile.mkdtemp()
+    def test_html_report_legacy_marker(self):
+        """
+        HtmlReport: load from file (legacy 'reportData' marker)
+        """
+        html_report_file = self._make_report(
+            "report_legacy.html",
+            b'<script>\nconst reportData={"flow_cell": "PAW15677"}\n'
+            b'</script>\n')
+        self.assertEqual(HtmlReport(html_report_file).extract_json(),
+                         {"flow_cell": "PAW15677"})
 
-    def tearDown(self):
-        if Path(self.wd).exists():
-            shutil.rmtree(self.wd)
+    def test_html_report_leading_whitespace_and_crlf(self):
+        """
+        HtmlReport: load from file (leading whitespace, CRLF line endings)
+        """
+        html_report_file = self._make_report(
+            "report_crlf.html",
+            b'<html>\r\n'
+            b'  <script>const reportDataJson = {"ignored": true};\r\n'
+            b'    const reportDataJson = {"flow_cell": "PAW15677"};\r\n'
+            b'</html>\r\n')
+        self.assertEqual(HtmlReport(html_report_file).extract_json(),
+                         {"flow_cell": "PAW15677"})
+
+    def test_html_report_marker_without_json(self):
+        """
+        HtmlReport: raise exception if no JSON follows marker
+        """
+        html_report_file = self._make_report(
+            "report_no_json.html",
+            b'<html>\nconst reportDataJson = \n</html>\n')
+        self.assertRaises(Exception,
+                          HtmlReport(html_report_file).extract_json)
+        html_report_file = self._make_report(
+            "report_truncated_json.html",
+            b'<html>\nconst reportDataJson = {\n</html>\n')
+        self.assertRaises(ValueError,
+                          HtmlReport(html_report_file).extract_json)
+
+    def test_html_report_empty_file(self):
+        """
+        HtmlReport: raise exception for empty file
+        """
+        html_report_file = self._make_report("report_empty.html", b"")
+        self.assertRaises(Exception,
+                          HtmlReport(html_report_file).extract_json)
+
+class TestJsonReport(SharedTempDirTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Mock report shared by the tests
+        cls.json_report_file = str(Path(cls._base_dir).joinpath(
+            "report_BLAH.json"))
+        create_json_report(cls.json_report_file)
 
     def test_json_report(self):
         """
         JsonReport: load from file
         """
-        json_report_file = Path(self.wd).joinpath("report_BLAH.json")
-        create_json_report(str(json_report_file))
-        json_report = JsonReport(str(json_report_file))
+        json_report = JsonReport(self.json_report_file)
         self.assertIsNotNone(json_report.extract_json())
 
-class TestBasecallsMetadata(unittest.TestCase):
-
-    def setUp(self):
-        self.wd = tempfile.mkdtemp()
-
-    def tearDown(self):
-        if Path(self.wd).exists():
-            shutil.rmtree(self.wd)
+class TestBasecallsMetadata(SharedTempDirTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Mock HTML and JSON reports for each MinKNOW version,
+        # shared by the tests
+        cls.html_reports = {}
+        cls.json_reports = {}
+        for minknow_version in ("24", "25"):
+            reports_dir = Path(cls._base_dir).joinpath(
+                f"reports_v{minknow_version}")
+            reports_dir.mkdir()
+            html_report_file = str(reports_dir.joinpath("report_BLAH.html"))
+            create_html_report(html_report_file,
+                               minknow_version=minknow_version)
+            cls.html_reports[minknow_version] = html_report_file
+            json_report_file = str(reports_dir.joinpath("report_BLAH.json"))
+            create_json_report(json_report_file,
+                               minknow_version=minknow_version)
+            cls.json_reports[minknow_version] = json_report_file
 
     def test_basecalls_metadata_no_file(self):
         """
@@ -330,13 +398,9 @@ class TestBasecallsMetadata(unittest.TestCase):
         """
         BasecallsMetadata: load from file (MinKNOW v24.*)
         """
-        html_report_file = Path(self.wd).joinpath("report_BLAH.html")
-        create_html_report(str(html_report_file), minknow_version="24")
-        json_report_file = Path(self.wd).joinpath("report_BLAH.json")
-        create_json_report(str(json_report_file), minknow_version="24")
         data = BasecallsMetadata()
-        data.load_from_report_html(str(html_report_file))
-        data.load_from_report_json(str(json_report_file))
+        data.load_from_report_html(self.html_reports["24"])
+        data.load_from_report_json(self.json_reports["24"])
         self.assertEqual(data.flow_cell_id, "PAW15677")
         self.assertEqual(data.flow_cell_type, "FLO-PRO114M")
         self.assertEqual(data.kit, "SQK-RBK114-24")
@@ -354,13 +418,9 @@ class TestBasecallsMetadata(unittest.TestCase):
         """
         BasecallsMetadata: load from file (MinKNOW v25.*)
         """
-        html_report_file = Path(self.wd).joinpath("report_BLAH.html")
-        create_html_report(str(html_report_file), minknow_version="25")
-        json_report_file = Path(self.wd).joinpath("report_BLAH.json")
-        create_json_report(str(json_report_file), minknow_version="25")
         data = BasecallsMetadata()
-        data.load_from_report_html(str(html_report_file))
-        data.load_from_report_json(str(json_report_file))
+        data.load_from_report_html(self.html_reports["25"])
+        data.load_from_report_json(self.json_reports["25"])
         self.assertEqual(data.flow_cell_id, "PBC32212")
         self.assertEqual(data.flow_cell_type, "FLO-PRO114M")
         self.assertEqual(data.kit, "SQK-PCB114-24")
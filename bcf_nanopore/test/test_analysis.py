@@ -124,6 +124,48 @@ class TestProjectAnalysisDir(unittest.TestCase):
         self.assertEqual(analysis_dir.datestamp_short("PG1-2_20240513"), "240513")
         self.assertEqual(analysis_dir.datestamp_short("PG3-4_20240529"), "240529")
 
+    def test_project_analysis_dir_create_multiple_runs_copy_reports(self):
+        """
+        ProjectAnalysisDir: create new analysis directory (multiple runs, check copied reports)
+        """
+        data_dir = MockPromethionDataDir("PromethION_Project_001_PerGynt")
+        data_dir.add_flow_cell("20240513_0829_1A_PAW15419_465bb23f",
+                               relpath=Path("PG1-2_20240513").joinpath("PG1-2"))
+        data_dir.add_basecalls_dir(str(Path("PG1-2_20240513").joinpath("Rebasecalling","PG1-2")),
+                                   flow_cell_name="20240513_0829_1A_PAW15419_465bb23f")
+        data_dir.add_flow_cell("20240529_0830_1A_PAW17328_523ce32d",
+                               relpath=Path("PG3-4_20240529").joinpath("PG3-4"))
+        data_dir.add_basecalls_dir(str(Path("PG3-4_20240529").joinpath("Rebasecalling","PG3-4")),
+                                   flow_cell_name="20240529_0830_1A_PAW17328_523ce32d")
+        project_dir = data_dir.create(self.wd)
+        analysis_dir_path = str(Path(self.wd).joinpath("PromethION_Project_001_PerGynt_analysis"))
+        analysis_dir = ProjectAnalysisDir(analysis_dir_path)
+        analysis_dir.create(project_dir,
+                            user="Per Gynt",
+                            PI="Henrik Ibsen",
+                            application="Methylation study",
+                            organism="Human")
+        self.assertEqual(analysis_dir.runs, ["PG1-2_20240513", "PG3-4_20240529"])
+        # Check that each run directory only has copies of the
+        # reports from its own flow cells and basecalls directories
+        # NB flow cell ID for basecalls reports comes from the
+        # metadata in the mock report
+        expected_reports = {
+            "001_PG1-2_20240513": [
+                "PG1-2_20240513_PAW15419_report_20240513_0829_1A_PAW15419_465bb23f.html",
+                "Rebasecalling_PG1-2_20240513_PBC32212_report_20240513_0829_1A_PAW15419_465bb23f.html"
+            ],
+            "002_PG3-4_20240529": [
+                "PG3-4_20240529_PAW17328_report_20240529_0830_1A_PAW17328_523ce32d.html",
+                "Rebasecalling_PG3-4_20240529_PBC32212_report_20240529_0830_1A_PAW17328_523ce32d.html"
+            ]
+        }
+        for run in expected_reports:
+            run_dir = Path(analysis_dir_path).joinpath(run)
+            reports = sorted([f.name for f in run_dir.glob("*_report_*.html")])
+            self.assertEqual(reports, expected_reports[run],
+                             f"Unexpected reports in run directory '{run}'")
+
     def test_project_analysis_dir_create_custom_project_metadata(self):
         """
         ProjectAnalysisDir: create new analysis directory with custom project metadata
@@ -750,6 +792,34 @@ class TestProjectAnalysisDir(unittest.TestCase):
             analysis_dir.report_project_runs("name,run,#samples,user,pi,analysts,order_numbers"),
             "PromethION_Project_001_PerGynt\tPG1-2_20240513\t2\tPer Gynt\tHenrik Ibsen\tSam Beckett\t#00123")
 
+    def test_project_analysis_dir_single_run_report_project_runs_field_case(self):
+        """
+        ProjectAnalysisDir: report runs for analysis project (case of field names)
+        """
+        data_dir = "/mnt/data/PromethION_Project_001_PerGynt"
+        analysis_dir = MockProjectAnalysisDir("PromethION_Project_001_PerGynt_analysis",)
+        analysis_dir.add_run("PG1-2_20240513",
+                             samples={"PG1": ("NB03", "PAW14589"),
+                                      "PG2": ("NB04", "PAW14589")})
+        analysis_dir_path = analysis_dir.create(
+            self.wd,
+            user="Per Gynt",
+            principal_investigator="Henrik Ibsen",
+            application="Methylation study",
+            organism="Human",
+            data_dir=data_dir,
+            project_id="PROMETHION#001")
+        analysis_dir = ProjectAnalysisDir(analysis_dir_path)
+        # 'null' is case-insensitive
+        self.assertEqual(
+            analysis_dir.report_project_runs("name,NULL,Null,run"),
+            "PromethION_Project_001_PerGynt\t\t\tPG1-2_20240513")
+        # Other built-in fields are not (so fall through to
+        # custom metadata items)
+        self.assertRaises(KeyError,
+                          analysis_dir.report_project_runs,
+                          "Name,run")
+
     def test_project_analysis_dir_single_run_report_project_runs_datestamps(self):
         """
         ProjectAnalysisDir: handle datestamps when reporting runs
@@ -773,6 +843,39 @@ class TestProjectAnalysisDir(unittest.TestCase):
                 "datestamp,datestamp_short,run_datestamp,run_datestamp_short,name,run,#samples"),
             "20240513\t240513\t20240513\t240513\tPromethION_Project_001_PerGynt\tPG1-2_20240513\t2")
 
+    def test_project_analysis_dir_single_run_report_project_runs_field_list(self):
+        """
+        ProjectAnalysisDir: report runs for analysis project (list of fields)
+        """
+        data_dir = "/mnt/data/PromethION_Project_001_PerGynt"
+        analysis_dir = MockProjectAnalysisDir("PromethION_Project_001_PerGynt_analysis",)
+        analysis_dir.add_run("PG1-2_20240513",
+                             samples={"PG1": ("NB03", "PAW14589"),
+                                      "PG2": ("NB04", "PAW14589")},)
+        analysis_dir_path = analysis_dir.create(
+            self.wd,
+            user="Per Gynt",
+            principal_investigator="Henrik Ibsen",
+            application="Methylation study",
+            organism="Human",
+            data_dir=data_dir,
+            project_id="PROMETHION#001")
+        analysis_dir = ProjectAnalysisDir(analysis_dir_path)
+        self.assertEqual(
+            analysis_dir.report_project_runs(["name", "run", "#samples"]),
+            "PromethION_Project_001_PerGynt\tPG1-2_20240513\t2")
+
+    def test_project_analysis_dir_make_project_id(self):
+        """
+        ProjectAnalysisDir: generate project ID from project name
+        """
+        self.assertEqual(
+            ProjectAnalysisDir._make_project_id("PromethION_Project_009_PerGynt"),
+            "PROMETHION#009")
+        self.assertRaises(ValueError,
+                          ProjectAnalysisDir._make_project_id,
+                          "PerGynt_Project_009")
+
 
 class TestFlowcellBasecallsInfo(unittest.TestCase):
 
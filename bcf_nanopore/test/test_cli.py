@@ -2,6 +2,7 @@
 
 # Tests for the 'cli' module
 
+import io
 import os
 import pwd
 import grp
@@ -9,6 +10,7 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from contextlib import redirect_stdout
 from bcf_nanopore.analysis import ProjectAnalysisDir
 from bcf_nanopore.analysis import ProjectInfo
 from bcf_nanopore.analysis import RunInfo
@@ -42,7 +44,16 @@ class TestInfoCommand(unittest.TestCase):
         data_dir.add_basecalls_dir(str(Path("PG1-4_20240513").joinpath("Rebasecalling","PG1-2")),
                                    flow_cell_name="20240513_0829_1A_PAW15419_465bb23f")
         project_dir = data_dir.create(self.wd)
-        cli_info(project_dir)
+        self.assertEqual(cli_info(project_dir), 0)
+
+    def test_info_no_flow_cells(self):
+        """
+        info: handle project with no flow cells or basecalls directories
+        """
+        project_dir = os.path.join(self.wd, "PromethION_Project_001_PerGynt")
+        os.mkdir(project_dir)
+        os.mkdir(os.path.join(project_dir, "PG1-4_20240513"))
+        self.assertEqual(cli_info(project_dir), 1)
 
 class TestSetupCommand(unittest.TestCase):
 
@@ -480,6 +491,43 @@ class TestFetchCommand(unittest.TestCase):
         cli_fetch(project_dir, target_dir, runner="SimpleJobRunner(join_logs=True)")
         self.assertTrue(Path(target_dir).joinpath("PromethION_Project_001_PerGynt").exists())
 
+    def test_fetch_verbose(self):
+        """
+        fetch: copy PromethION data (verbose output)
+        """
+        # Make source data
+        data_dir = MockPromethionDataDir("PromethION_Project_001_PerGynt")
+        data_dir.add_flow_cell("20240513_0829_1A_PAW15419_465bb23f",
+                               relpath=Path("PG1-4_20240513").joinpath("PG1-2"))
+        data_dir.add_basecalls_dir(str(Path("PG1-4_20240513").joinpath("Rebasecalling","PG1-2")),
+                                   flow_cell_name="20240513_0829_1A_PAW15419_465bb23f")
+        source_dir = os.path.join(self.wd, "source")
+        os.mkdir(source_dir)
+        project_dir = data_dir.create(source_dir)
+        # Fetch subset with verbose output
+        target_dir = os.path.join(self.wd, "target")
+        output = io.StringIO()
+        with redirect_stdout(output):
+            cli_fetch(project_dir, target_dir, verbose=True)
+        self.assertTrue(Path(target_dir).joinpath("PromethION_Project_001_PerGynt").exists())
+        # Full rsync command line should be reported
+        self.assertTrue("Transferring data and report files with "
+                        "command: rsync -av -m -W " in output.getvalue())
+        self.assertTrue(f" {project_dir} {target_dir}\n" in output.getvalue())
+        self.assertFalse(f"from {project_dir} to {target_dir}"
+                         in output.getvalue())
+        # Fetch again without verbose output
+        target_dir = os.path.join(self.wd, "target2")
+        output = io.StringIO()
+        with redirect_stdout(output):
+            cli_fetch(project_dir, target_dir)
+        self.assertTrue(Path(target_dir).joinpath("PromethION_Project_001_PerGynt").exists())
+        # Only the summary should be reported
+        self.assertTrue(f"Transferring data and report files from "
+                        f"{project_dir} to {target_dir}"
+                        in output.getvalue())
+        self.assertFalse("rsync -av -m -W" in output.getvalue())
+
     def test_fetch_set_permissions(self):
         """
         fetch: copy PromethION data (set permissions)
@@ -624,6 +672,50 @@ Analysis dir    : {analysis_dir_path}
 
 This project has 2 runs:
 
+- PG1-2_20240513:	2 samples (PG1, PG2)
+- PG3-4_20240529:	2 samples (PG3, PG4)
+"""
+        self.assertTrue(out_file.exists())
+        with open(out_file, "rt") as fp:
+            self.assertEqual(fp.read(), expected_report)
+
+    def test_report_project_to_directory(self):
+        """
+        report: write report for a project into a directory
+        """
+        data_dir = "/mnt/data/PromethION_Project_001_PerGynt"
+        analysis_dir = MockProjectAnalysisDir("PromethION_Project_001_PerGynt_analysis")
+        analysis_dir.add_run("PG1-2_20240513",
+                             samples={ "PG1": ("NB03", "PAW14589"),
+                                       "PG2": ("NB04", "PAW14589")})
+        analysis_dir.add_run("PG3-4_20240529",
+                             samples={ "PG3": ("NB07", "PAW15894"),
+                                       "PG4": ("NB08", "PAW15894")})
+        analysis_dir_path = analysis_dir.create(
+            self.wd,
+            user="Per Gynt",
+            principal_investigator="Henrik Ibsen",
+            application="Methylation study",
+            organism="Human",
+            data_dir=data_dir,
+            project_id="PROMETHION#001")
+        out_dir = Path(self.wd).joinpath("reports")
+        out_dir.mkdir()
+        cli_report(analysis_dir_path, mode="summary", out_file=out_dir)
+        out_file = out_dir.joinpath("promethion#001.txt")
+        expected_report = f"""PromethION_Project_001_PerGynt
+==============================
+
+Project name    : PromethION_Project_001_PerGynt
+Project ID      : PROMETHION#001
+User            : Per Gynt
+PI              : Henrik Ibsen
+Application     : Methylation study
+Organism        : Human
+Analysis dir    : {analysis_dir_path}
+
+This project has 2 runs:
+
 - PG1-2_20240513:	2 samples (PG1, PG2)
 - PG3-4_20240529:	2 samples (PG3, PG4)
 """
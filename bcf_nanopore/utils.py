@@ -260,9 +260,10 @@ class MetadataTabFile(TabFile):
         Arguments:
           name (str): index value to check for matching entry
         """
-        return (name.lstrip('#') in
-                [entry[self.index].lstrip('#')
-                 for entry in self])
+        name = name.lstrip('#')
+        index = self.index
+        return any(entry[index].lstrip('#') == name
+                   for entry in self)
 
 
 def execute_command(cmd, runner=None, jobname=None):